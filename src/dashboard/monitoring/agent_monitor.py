@@ -3,12 +3,18 @@
 import asyncio
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from src.error_management.factory import ServiceFactory
 
+# Maximum number of log entries kept per agent; older entries are dropped
+MAX_AGENT_LOGS = 1000
+# Seconds start_agent waits for the monitor thread's first metrics tick
+START_TIMEOUT = 0.5
+
 
 class AgentMonitor:
     """Monitors agent metrics, status, and activities."""
@@ -25,6 +31,11 @@ class AgentMonitor:
         self._lock = threading.Lock()
         self._loop = asyncio.get_event_loop()
         self._metrics_counter = 0  # Synchronized counter for metrics updates
+        # Set by each monitor thread after its first metrics tick and on exit
+        self._started: Dict[str, threading.Event] = {}
+        self._stopped: Dict[str, threading.Event] = {}
+        # Set by stop_agent to wake a monitor thread between ticks
+        self._stop_events: Dict[str, threading.Event] = {}
 
         # Initialize services
         self._memory_manager, self._metrics_collector, self._error_service = (
@@ -37,6 +48,9 @@ class AgentMonitor:
     def start_agent(self, agent_id: str) -> bool:
         """Start monitoring an agent.
 
+        Blocks until the monitor thread has published its first metrics tick,
+        or for at most START_TIMEOUT seconds.
+
         Args:
             agent_id: Unique identifier for the agent
 
@@ -63,15 +77,19 @@ class AgentMonitor:
                     "vulnerabilities": 0,
                     "last_scan": datetime.now(),
                 },
-                "logs": [],
-                "activities": [
-                    {
-                        "timestamp": datetime.now(),
-                        "type": "Agent Start",
-                        "status": "Success",
-                        "details": f"Agent {agent_id} started",
-                    }
-                ],
+                # Deques give O(1) appends (trimmed to MAX_AGENT_LOGS) and O(1)
+                # appendleft for newest-first activities
+                "logs": deque(maxlen=MAX_AGENT_LOGS),
+                "activities": deque(
+                    [
+                        {
+                            "timestamp": datetime.now(),
+                            "type": "Agent Start",
+                            "status": "Success",
+                            "details": f"Agent {agent_id} started",
+                        }
+                    ]
+                ),
                 "container": {
                     "status": "running",
                     "image": "error-management-agent:latest",
@@ -83,13 +101,19 @@ class AgentMonitor:
             }
 
             # Start monitoring thread
+            started = self._started[agent_id] = threading.Event()
+            self._stopped[agent_id] = threading.Event()
+            self._stop_events[agent_id] = threading.Event()
             monitor_thread = threading.Thread(
                 target=self._monitor_agent, args=(agent_id,), daemon=True
             )
             self._monitors[agent_id] = monitor_thread
             monitor_thread.start()
 
-            return True
+        # Return once the first metrics tick is published; the thread takes the
+        # lock for that tick, so wait after releasing it
+        started.wait(timeout=START_TIMEOUT)
+        return True
 
     def stop_agent(self, agent_id: str) -> bool:
         """Stop monitoring an agent.
@@ -107,12 +131,15 @@ class AgentMonitor:
             # Update status
             self._agents[agent_id]["status"] = "stopped"
 
-            # Stop and remove monitor thread
-            if agent_id in self._monitors:
-                thread = self._monitors.pop(agent_id)
-                thread.join(timeout=1)
+            # Remove monitor thread and wake it if it is between ticks
+            thread = self._monitors.pop(agent_id, None)
+            self._stop_events[agent_id].set()
 
-            return True
+        # The thread takes the lock to check its status, so join after
+        # releasing it
+        if thread is not None:
+            thread.join(timeout=1)
+        return True
 
     def get_agent_status(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """Get current status of an agent.
@@ -126,11 +153,16 @@ class AgentMonitor:
         with self._lock:
             if agent_id not in self._agents:
                 return None
-            status = {
-                k: v.copy() if isinstance(v, dict) else v
-                for k, v in self._agents[agent_id].items()
-                if not k.startswith("_")
-            }  # Exclude private fields
+            status = {}
+            for k, v in self._agents[agent_id].items():
+                if k.startswith("_"):
+                    continue  # Exclude private fields
+                if isinstance(v, dict):
+                    v = v.copy()
+                elif isinstance(v, deque):
+                    # Logs and activities: never hand out the live deques
+                    v = list(v)
+                status[k] = v
             return status
 
     def get_agent_logs(self, agent_id: str) -> List[Dict[str, Any]]:
@@ -145,7 +177,7 @@ class AgentMonitor:
         with self._lock:
             if agent_id not in self._agents:
                 return []
-            return self._agents[agent_id]["logs"].copy()
+            return list(self._agents[agent_id]["logs"])
 
     def get_agent_activities(self, agent_id: str) -> List[Dict[str, Any]]:
         """Get activity history for an agent.
@@ -159,7 +191,7 @@ class AgentMonitor:
         with self._lock:
             if agent_id not in self._agents:
                 return []
-            return self._agents[agent_id]["activities"].copy()
+            return list(self._agents[agent_id]["activities"])
 
     def get_agent_security(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """Get security metrics for an agent.
@@ -230,6 +262,7 @@ class AgentMonitor:
                                 )
                             self._agents[agent_id]["_update_count"] += 1
                             self._metrics_counter += 1
+                    self._started[agent_id].set()
 
                 except StopIteration:
                     # If mock runs out of values, keep last metrics
@@ -240,8 +273,9 @@ class AgentMonitor:
                     self._update_security(agent_id), self._loop
                 )
 
-                # Sleep between updates
-                time.sleep(0.1)
+                # Sleep between updates, waking early if stopped
+                if self._stop_events[agent_id].wait(0.1):
+                    break
 
         except Exception as e:
             # Log error with minimal lock time
@@ -254,6 +288,10 @@ class AgentMonitor:
                             "message": f"Monitoring error: {str(e)}",
                         }
                     )
+        finally:
+            # Release waiters even if the first tick never completed
+            self._started[agent_id].set()
+            self._stopped[agent_id].set()
 
     async def _update_security(self, agent_id: str) -> None:
         """Update security metrics for an agent.
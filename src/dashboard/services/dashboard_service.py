@@ -159,6 +159,10 @@ class DashboardService:
         except Exception as e:
             logger.error(f"Error adding notification: {e}")
 
+    def clear_notifications(self):
+        """Remove all notifications."""
+        self.notifications.clear()
+
     async def get_active_errors(self) -> List[Dict[str, Any]]:
         """Get list of active errors."""
         try:
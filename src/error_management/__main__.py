@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import signal
 from pathlib import Path
 
 from .error_manager import ErrorManager
@@ -27,12 +28,25 @@ async def main():
         project_path = Path.cwd()
         error_manager = ErrorManager(project_path)
 
+        # Stop on SIGINT/SIGTERM; the handlers run on the loop, so they can set
+        # the event directly
+        shutdown = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, shutdown.set)
+            except NotImplementedError:
+                # Not available on Windows; Ctrl+C still interrupts asyncio.run
+                pass
+
         # Start error manager
         await error_manager.start()
 
-        # Keep running
-        while True:
-            await asyncio.sleep(1)
+        # Keep running until a shutdown signal arrives
+        try:
+            await shutdown.wait()
+        finally:
+            await error_manager.stop()
 
     except Exception as e:
         logger.error(f"Failed to start error management system: {str(e)}")
@@ -76,6 +76,13 @@ class ErrorManager:
             self.errors[error.id] = error
             logger.info(f"Added error {error.id}: {error.message}")
 
+    async def add_errors(self, errors: List[ErrorModel]):
+        """Add several errors under a single lock acquisition."""
+        async with self._lock:
+            for error in errors:
+                self.errors[error.id] = error
+            logger.info(f"Added {len(errors)} errors")
+
     async def get_error(self, error_id: str) -> Optional[ErrorModel]:
         """Get error by ID."""
         async with self._lock:
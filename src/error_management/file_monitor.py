@@ -4,15 +4,19 @@ File Monitor - Monitors file system changes and triggers error detection
 
 import ast
 import asyncio
+import hashlib
 import logging
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import aiofiles
-from watchdog.events import FileModifiedEvent, FileSystemEventHandler
+import aiofiles.os
+from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 from src.error_management.models import Error
@@ -32,8 +36,114 @@ DANGEROUS_PATTERNS = [
     (r"(rm|remove|rmdir|unlink)\s*\(", "File deletion operation detected"),
 ]
 
+# Single-pass scanner: group "p0" is a bare except, "p<n>" is DANGEROUS_PATTERNS[n-1].
+# The lookahead keeps matches zero-width so overlapping patterns are all reported.
+COMBINED_PATTERN = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<p{i}>{pattern})"
+        for i, pattern in enumerate(
+            [r"except:"] + [pattern for pattern, _ in DANGEROUS_PATTERNS]
+        )
+    )
+    + ")"
+)
+
+# Limits for streamed file analysis
+MAX_ANALYZE_FILE_SIZE = 2_000_000
+ANALYZE_CHUNK_SIZE = 64 * 1024
+ANALYZE_CHUNK_OVERLAP = 256
+
+# Files analyzed at once after modification events
+MAX_CONCURRENT_ANALYSES = 8
+
+# Below this many files, analyze_project parses in-process; spawning worker
+# processes costs more than it saves on small projects
+MIN_FILES_FOR_POOL = 32
+
+# Event filters applied by watchdog before events reach Python handlers
+WATCH_PATTERNS = ["*.py"]
+IGNORE_PATTERNS = [
+    "*/__pycache__/*",
+    "*/.git/*",
+    "*/node_modules/*",
+    "*/.pytest_cache/*",
+]
+
+
+def _find_unreachable_code(node: ast.FunctionDef) -> Optional[int]:
+    """Check for unreachable code in a function.
+
+    Returns the line number of the return statement if unreachable code is found,
+    otherwise returns None.
+    """
+    has_return = False
+    return_line = None
+
+    for stmt in ast.walk(node):
+        if isinstance(stmt, ast.Return):
+            has_return = True
+            return_line = stmt.lineno
+        elif has_return and hasattr(stmt, "lineno") and stmt.lineno > return_line:
+            return return_line
+
+    return None
+
+
+def _analyze_worker(file_path: str) -> Tuple[bytes, List[Tuple[int, str, str]]]:
+    """Parse a Python file and collect its issues.
+
+    Only plain data is returned so the function can run in a worker process.
+
+    Returns:
+        The digest of the file content, for the issue cache, and a list of
+        ``(line_number, error_type, message)`` tuples
+    """
+    with open(file_path, "rb") as f:
+        content = f.read()
+    return _content_digest(content), _analyze_source(content)
+
+
+def _content_digest(content: bytes) -> bytes:
+    """Digest identifying file content in the issue cache."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
 
-class FileMonitor(FileSystemEventHandler):
+def _analyze_source(content: bytes) -> List[Tuple[int, str, str]]:
+    """Parse Python source and collect its issues.
+
+    Returns:
+        List of ``(line_number, error_type, message)`` tuples
+    """
+    try:
+        tree = ast.parse(content)
+    except SyntaxError as e:
+        return [(e.lineno, "SyntaxError", str(e))]
+
+    # Check for common issues
+    issues = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            # Check for missing docstring
+            if not ast.get_docstring(node):
+                issues.append(
+                    (
+                        node.lineno,
+                        "Style",
+                        f"Missing docstring in function '{node.name}'",
+                    )
+                )
+
+            # Check for unreachable code
+            if return_line := _find_unreachable_code(node):
+                issues.append(
+                    (return_line, "Logic", "Unreachable code after return statement")
+                )
+
+    return issues
+
+
+class FileMonitor(PatternMatchingEventHandler):
     """Monitor files for changes and errors."""
 
     def __init__(self, project_root: Path, error_manager):
@@ -43,12 +153,22 @@ class FileMonitor(FileSystemEventHandler):
             project_root: Path to project root directory
             error_manager: Error manager instance
         """
+        super().__init__(
+            patterns=WATCH_PATTERNS,
+            ignore_patterns=IGNORE_PATTERNS,
+            ignore_directories=True,
+        )
         self.project_root = Path(project_root).resolve()
         self.error_manager = error_manager
         self.running = False
         self.task: Optional[asyncio.Task] = None
         self.observer = Observer()
         self.loop = None
+        # Per file, the digest of the last analyzed content and its issues;
+        # saves with unchanged content are not parsed again
+        self._issue_cache: Dict[Path, Tuple[bytes, List[Tuple[int, str, str]]]] = {}
+        # Modified paths handed over from the observer thread
+        self._queue: "asyncio.Queue[Path]" = asyncio.Queue()
         self.excluded_patterns = {
             "*.pyc",
             "__pycache__",
@@ -84,22 +204,43 @@ class FileMonitor(FileSystemEventHandler):
             return False
 
     def _check_unreachable_code(self, node: ast.FunctionDef) -> Optional[int]:
-        """Check for unreachable code in a function.
-
-        Returns the line number of the return statement if unreachable code is found,
-        otherwise returns None.
-        """
-        has_return = False
-        return_line = None
+        """Check for unreachable code in a function."""
+        return _find_unreachable_code(node)
 
-        for stmt in ast.walk(node):
-            if isinstance(stmt, ast.Return):
-                has_return = True
-                return_line = stmt.lineno
-            elif has_return and hasattr(stmt, "lineno") and stmt.lineno > return_line:
-                return return_line
+    def _iter_python_files(self) -> Iterator[str]:
+        """Yield paths of Python files below the project root."""
+        stack = [str(self.project_root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            yield entry.path
+            except OSError as e:
+                logging.error(f"Error scanning directory: {e}")
+
+    @staticmethod
+    def _build_errors(
+        file_path: Path, issues: List[Tuple[int, str, str]]
+    ) -> List[Error]:
+        """Turn issues found by ``_analyze_source`` into errors."""
+        return [
+            Error(
+                id=f"{file_path}:{line_number}",
+                file_path=file_path,
+                line_number=line_number,
+                error_type=error_type,
+                message=message,
+            )
+            for line_number, error_type, message in issues
+        ]
 
-        return None
+    async def _report_errors(self, errors: List[Error]) -> None:
+        """Forward errors to the error manager in one batch."""
+        if errors:
+            await self.error_manager.add_errors(errors)
 
     async def analyze_python_file(self, file_path: Path) -> None:
         """Analyze a Python file for errors."""
@@ -107,50 +248,65 @@ class FileMonitor(FileSystemEventHandler):
             if not self.should_monitor_file(file_path):
                 return
 
-            with open(file_path, "r") as f:
-                content = f.read()
+            content = file_path.read_bytes()
+            digest = _content_digest(content)
+            cached = self._issue_cache.get(file_path)
+            if cached is not None and cached[0] == digest:
+                issues = cached[1]
+            else:
+                issues = _analyze_source(content)
+                self._issue_cache[file_path] = (digest, issues)
 
-            try:
-                tree = ast.parse(content)
-            except SyntaxError as e:
-                error = Error(
-                    id=f"{file_path}:{e.lineno}",
-                    file_path=file_path,
-                    line_number=e.lineno,
-                    error_type="SyntaxError",
-                    message=str(e),
-                )
-                await self.error_manager.add_error_async(error)
-                return
-
-            # Check for common issues
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Check for missing docstring
-                    if not ast.get_docstring(node):
-                        error = Error(
-                            id=f"{file_path}:{node.lineno}",
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            error_type="Style",
-                            message=f"Missing docstring in function '{node.name}'",
-                        )
-                        await self.error_manager.add_error_async(error)
-
-                    # Check for unreachable code
-                    if return_line := self._check_unreachable_code(node):
-                        error = Error(
-                            id=f"{file_path}:{return_line}",
-                            file_path=file_path,
-                            line_number=return_line,
-                            error_type="Logic",
-                            message="Unreachable code after return statement",
-                        )
-                        await self.error_manager.add_error_async(error)
+            await self._report_errors(self._build_errors(file_path, issues))
 
         except Exception as e:
             logging.error(f"Error analyzing file {file_path}: {e}")
 
+    async def analyze_project(self) -> None:
+        """Analyze all existing Python files, in a process pool for large projects."""
+        paths = [
+            path
+            for path in self._iter_python_files()
+            if self.should_monitor_file(Path(path))
+        ]
+        if not paths:
+            return
+
+        if len(paths) < MIN_FILES_FOR_POOL:
+            results = []
+            for path in paths:
+                try:
+                    results.append(_analyze_worker(path))
+                except Exception as e:
+                    results.append(e)
+        else:
+            loop = asyncio.get_running_loop()
+            # Spawn rather than fork: the watchdog observer thread is already
+            # running, and forking a threaded process can deadlock the children
+            with ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, len(paths)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, _analyze_worker, path)
+                        for path in paths
+                    ),
+                    return_exceptions=True,
+                )
+
+        errors = []
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                logging.error(f"Error analyzing file {path}: {result}")
+                continue
+            digest, issues = result
+            file_path = Path(path)
+            # Later saves with unchanged content reuse these issues
+            self._issue_cache[file_path] = (digest, issues)
+            errors.extend(self._build_errors(file_path, issues))
+        await self._report_errors(errors)
+
     async def start(self):
         """Start monitoring files."""
         if self.running:
@@ -163,8 +319,7 @@ class FileMonitor(FileSystemEventHandler):
         self.task = self.loop.create_task(self._monitor())
 
         # Initial analysis of existing files
-        for file_path in self.project_root.rglob("*.py"):
-            await self.analyze_python_file(file_path)
+        await self.analyze_project()
 
     async def stop(self):
         """Stop monitoring files."""
@@ -183,64 +338,94 @@ class FileMonitor(FileSystemEventHandler):
         self.observer.join()
 
     async def _monitor(self):
-        """Monitor files for changes."""
+        """Analyze files queued by ``on_modified``, a few at a time."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        pending = set()
         try:
             while self.running:
-                await asyncio.sleep(1)
+                file_path = await self._queue.get()
+                await semaphore.acquire()
+                task = asyncio.create_task(self.analyze_python_file(file_path))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                task.add_done_callback(lambda _: semaphore.release())
         except asyncio.CancelledError:
-            pass
+            # Let analyses already under way report their issues
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         except Exception as e:
             logging.error(f"Error in file monitor: {e}")
 
     def on_modified(self, event):
-        """Handle file modification events."""
-        if not isinstance(event, FileModifiedEvent):
-            return
+        """Handle file modification events.
 
-        file_path = Path(event.src_path)
-        if self.should_monitor_file(file_path):
-            if self.loop is None:
-                try:
-                    self.loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    self.loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(self.loop)
+        Directory events and non-Python files are already filtered out by
+        watchdog; ``analyze_python_file`` applies the remaining exclusions.
+        """
+        if self.loop is None:
+            try:
+                self.loop = asyncio.get_event_loop()
+            except RuntimeError:
+                self.loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(self.loop)
 
-            asyncio.run_coroutine_threadsafe(
-                self.analyze_python_file(file_path), self.loop
-            )
+        # Only hand the path over; analysis runs in _monitor on the loop
+        self.loop.call_soon_threadsafe(self._queue.put_nowait, Path(event.src_path))
 
     async def analyze_file(self, filepath: str):
-        """Analyze a file for errors."""
+        """Analyze a file for errors.
+
+        Files that are not Python sources or exceed ``MAX_ANALYZE_FILE_SIZE``
+        are skipped. The content is streamed in chunks, keeping a small
+        overlap so that matches spanning a chunk boundary are not lost.
+        """
         try:
+            if not str(filepath).endswith(".py"):
+                return
+            stat = await aiofiles.os.stat(filepath)
+            if stat.st_size > MAX_ANALYZE_FILE_SIZE:
+                logger.info(f"Skipping large file {filepath} ({stat.st_size} bytes)")
+                return
+
+            matched = set()
+            newlines = 0
+            tail = ""
             async with aiofiles.open(filepath, "r") as f:
-                content = await f.read()
+                while chunk := await f.read(ANALYZE_CHUNK_SIZE):
+                    newlines += chunk.count("\n")
+                    window = tail + chunk
+                    for match in COMBINED_PATTERN.finditer(window):
+                        matched.add(match.lastgroup)
+                    tail = window[-ANALYZE_CHUNK_OVERLAP:]
+
+            # One timestamp for every error reported from this pass
+            now = datetime.now()
+
+            # Check for bare except
+            if "p0" in matched:
+                error = Error(
+                    id=f"{filepath}:1",
+                    file_path=filepath,
+                    line_number=1,
+                    error_type="BareExcept",
+                    message="Bare except found",
+                    timestamp=now,
+                )
+                await self.error_manager.add_error(error)
 
-                # Check for bare except
-                if "except:" in content:
+            # Check for dangerous patterns
+            for i, (_, message) in enumerate(DANGEROUS_PATTERNS, start=1):
+                if f"p{i}" in matched:
                     error = Error(
-                        id=f"{filepath}:1",
+                        id=f"{filepath}:{newlines + 1}",
                         file_path=filepath,
-                        line_number=1,
-                        error_type="BareExcept",
-                        message="Bare except found",
-                        timestamp=datetime.now(),
+                        line_number=newlines + 1,
+                        error_type="SecurityIssue",
+                        message=message,
+                        timestamp=now,
                     )
                     await self.error_manager.add_error(error)
 
-                # Check for dangerous patterns
-                for pattern, message in DANGEROUS_PATTERNS:
-                    if re.search(pattern, content):
-                        error = Error(
-                            id=f"{filepath}:{content.count(chr(10)) + 1}",
-                            file_path=filepath,
-                            line_number=content.count(chr(10)) + 1,
-                            error_type="SecurityIssue",
-                            message=message,
-                            timestamp=datetime.now(),
-                        )
-                        await self.error_manager.add_error(error)
-
         except Exception as e:
             logger.error(f"Error analyzing file {filepath}: {e}")
 
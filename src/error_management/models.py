@@ -41,9 +41,13 @@ class ErrorType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorContext:
-    """Error context information."""
+    """Error context information.
+
+    Contexts are built per error, so they use slots rather than a per-instance
+    dict.
+    """
 
     file_content: str
     line_content: str
@@ -9,7 +9,7 @@ from _pytest.nodes import Item
 from _pytest.reports import TestReport
 
 from .error_handler import error_handler
-from .service import error_management_service
+from .service import get_service
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ def pytest_configure(config: Config) -> None:
     """Configure pytest plugin."""
     try:
         # Initialize error management service
-        error_management_service.start()
+        get_service().start()
         logger.info("Error management service initialized for testing")
     except Exception as e:
         logger.error(f"Failed to initialize error management: {str(e)}")
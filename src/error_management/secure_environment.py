@@ -2,15 +2,21 @@
 
 import logging
 import os
-import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from src.error_management.models import Error
 
 logger = logging.getLogger(__name__)
 
+# File operations accepted by validate_operation
+ALLOWED_OPERATIONS = frozenset({"read", "write"})
+
 
 class SecurityError(Exception):
     """Security related error."""
@@ -32,13 +38,39 @@ class SecureEnvironment:
         r"/\.vscode/",
     ]
 
-    DANGEROUS_PATTERNS = [
-        r"os\.system",
-        r"subprocess\.call",
-        r"eval\(",
-        r"exec\(",
-        r"__import__",
-    ]
+    # Plain substrings; matched with str containment rather than regex
+    DANGEROUS_PATTERNS = (
+        "os.system",
+        "subprocess.call",
+        "eval(",
+        "exec(",
+        "__import__",
+    )
+
+    # Directory names matching EXCLUDED_PATTERNS; _is_excluded tests path
+    # components against this set instead of searching the patterns
+    EXCLUDED_DIRS = frozenset(
+        {
+            "node_modules",
+            ".git",
+            ".pytest_cache",
+            "__pycache__",
+            ".venv",
+            "venv",
+            ".env",
+            "site-packages",
+            ".idea",
+            ".vscode",
+        }
+    )
+
+    # Walk top-level subtrees concurrently in get_project_files; set to False
+    # for a single-threaded walk
+    _parallel_walk = True
+
+    # Thread pool shared by parallel walks across instances, created lazily
+    _walk_executor: Optional[ThreadPoolExecutor] = None
+    _walk_executor_lock = threading.Lock()
 
     def __init__(self, project_root: Path):
         """Initialize secure environment.
@@ -46,49 +78,133 @@ class SecureEnvironment:
         Args:
             project_root: Root directory of the project
         """
+        # Root as given, for the lexical check before paths are resolved
+        self._given_root_str = os.path.join(os.path.abspath(project_root), "")
         self.project_root = Path(project_root).resolve()
-        if not self.project_root.exists():
-            raise SecurityError(f"Project root does not exist: {self.project_root}")
+        # One stat for the common case; existence is only probed to pick the
+        # error message
         if not self.project_root.is_dir():
+            if not self.project_root.exists():
+                raise SecurityError(f"Project root does not exist: {self.project_root}")
             raise SecurityError(f"Project root is not a directory: {self.project_root}")
-
-    def _is_excluded(self, path: Path) -> bool:
+        self._project_root_str = os.path.join(str(self.project_root), "")
+        # Recent decisions keyed by absolute path, mapped to (monotonic time,
+        # result); they expire after _check_ttl so changes on disk, such as a
+        # file replaced by a symlink, are seen
+        self._check_cache: "OrderedDict[str, Tuple[float, Tuple[bool, str]]]" = (
+            OrderedDict()
+        )
+        self._check_ttl = 1.0
+        self._check_cache_size = 8192
+        self._check_lock = threading.Lock()
+
+    def _is_excluded(self, path: Union[str, Path]) -> bool:
         """Check if path matches excluded patterns."""
-        path_str = str(path)
-        return any(re.search(pattern, path_str) for pattern in self.EXCLUDED_PATTERNS)
+        # Patterns need a separator after the name, so the last component
+        # (a file, or "" for a trailing separator) is left out of the set test
+        return not self.EXCLUDED_DIRS.isdisjoint(str(path).split(os.sep)[:-1])
 
     def is_file_allowed(self, file_path: Path) -> bool:
         """Check if file is allowed for operations.
 
+        Results are cached per absolute path for a short time; call
+        reset_cache() to see a change to the file tree straight away.
+
         Args:
             file_path: Path to file
 
         Returns:
             bool: Whether file is allowed
         """
-        try:
-            file_path = Path(file_path).resolve()
+        return self._check(str(file_path))[0]
+
+    def _check(self, path_str: str) -> Tuple[bool, str]:
+        """Return the cached decision for a path, or check it afresh."""
+        # Relative paths are keyed by where they point now, not by spelling
+        abs_path = os.path.abspath(path_str)
+        now = time.monotonic()
+        with self._check_lock:
+            hit = self._check_cache.get(abs_path)
+            if hit is not None and now - hit[0] < self._check_ttl:
+                return hit[1]
+
+        result = self._check_uncached(abs_path)
+        with self._check_lock:
+            self._check_cache[abs_path] = (now, result)
+            self._check_cache.move_to_end(abs_path)
+            if len(self._check_cache) > self._check_cache_size:
+                self._check_cache.popitem(last=False)
+        return result
+
+    def _check_uncached(self, path_str: str) -> Tuple[bool, str]:
+        """Resolve a path once and check it against the project boundary.
 
-            # Check if file is within project boundary
-            try:
-                file_path.relative_to(self.project_root)
-            except ValueError:
-                return False
+        Args:
+            path_str: Absolute path to check
+
+        Returns:
+            Tuple of whether the path is allowed and its resolved form
+        """
+        resolved = path_str
+        try:
+            # Paths outside both the given and the resolved root are rejected
+            # before any syscall
+            expected = self._spelled_from_root(path_str)
+            if expected is None:
+                return False, resolved
+
+            # Without symlinks below the root, resolving only swaps the given
+            # root for the resolved one; any other difference means a link in
+            # the file itself or in one of its parent directories
+            resolved = os.path.realpath(path_str)
+            if resolved != expected:
+                logger.warning(f"Symlinked path rejected: {path_str}")
+                return False, resolved
 
             # Check excluded patterns
-            if self._is_excluded(file_path):
-                logger.warning(f"File matches excluded pattern: {file_path}")
-                return False
+            if self._is_excluded(resolved):
+                logger.warning(f"File matches excluded pattern: {resolved}")
+                return False, resolved
 
-            return True
+            return True, resolved
 
         except Exception as e:
             logger.error(f"Error checking file allowance: {e}")
-            return False
+            return False, resolved
+
+    def _spelled_from_root(self, path_str: str) -> Optional[str]:
+        """Spell an absolute path from the resolved project root, lexically.
+
+        Returns:
+            The normalized path below the resolved root, or None if the path
+            is spelled under neither the given nor the resolved root
+        """
+        path_str = os.path.join(os.path.normpath(path_str), "")
+        for root_str in (self._project_root_str, self._given_root_str):
+            if path_str.startswith(root_str):
+                return os.path.normpath(
+                    os.path.join(self._project_root_str, path_str[len(root_str) :])
+                )
+        return None
+
+    def reset_cache(self) -> None:
+        """Clear cached path validation results."""
+        with self._check_lock:
+            self._check_cache.clear()
+
+    def _is_file_allowed_trusted(self, path_str: str) -> bool:
+        """Check a path produced by our own walk of the project root.
+
+        Such paths are already rooted at the resolved project root, so the
+        resolve() and relative_to() work done by is_file_allowed is skipped.
+        """
+        return path_str.startswith(self._project_root_str) and not self._is_excluded(
+            path_str
+        )
 
     def _is_file_in_project(self, file_path: Path) -> bool:
         """Check if file is within project boundary."""
-        return self.is_file_allowed(file_path)
+        return self._check(str(file_path))[0]
 
     def validate_operation(self, operation: str, file_path: Path) -> bool:
         """Validate file operation.
@@ -101,18 +217,14 @@ class SecureEnvironment:
             bool: Whether operation is allowed
         """
         try:
-            if operation not in ["read", "write"]:
+            if operation not in ALLOWED_OPERATIONS:
                 logger.warning(f"Invalid operation: {operation}")
                 return False
 
-            file_path = Path(file_path).resolve()
-
-            if self._is_excluded(file_path):
-                logger.warning(f"File matches excluded pattern: {file_path}")
-                return False
-
-            if not self.is_file_allowed(file_path):
-                logger.info(f"Skipping virtual environment file: {file_path}")
+            # One resolve and exclusion scan, shared with is_file_allowed
+            allowed, resolved = self._check(str(file_path))
+            if not allowed:
+                logger.info(f"Skipping virtual environment file: {resolved}")
                 return False
 
             return True
@@ -136,10 +248,9 @@ class SecureEnvironment:
                 return False
 
             # Check for dangerous patterns
-            for pattern in self.DANGEROUS_PATTERNS:
-                if re.search(pattern, fix_content):
-                    logger.warning("Fix contains dangerous code patterns")
-                    return False
+            if any(pattern in fix_content for pattern in self.DANGEROUS_PATTERNS):
+                logger.warning("Fix contains dangerous code patterns")
+                return False
 
             return True
 
@@ -147,6 +258,77 @@ class SecureEnvironment:
             logger.error(f"Error verifying fix: {e}")
             return False
 
+    def _scan_dir(self, path: str) -> Tuple[List[str], List[str]]:
+        """List one directory, skipping excluded subdirectories.
+
+        Uses os.scandir so file types come from the directory entry instead of
+        an extra stat() per path. A directory that vanishes or cannot be read
+        is logged and treated as empty so the rest of the walk continues.
+
+        Returns:
+            Tuple of (subdirectories to descend into, file paths)
+        """
+        subdirs: List[str] = []
+        files: List[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if (
+                                entry.name not in self.EXCLUDED_DIRS
+                                and not self._is_excluded(os.path.join(entry.path, ""))
+                            ):
+                                subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.path)
+                    except OSError as e:
+                        logger.debug(f"Skipping unreadable entry {entry.path}: {e}")
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {path}: {e}")
+        return subdirs, files
+
+    def _iter_files(self, root: str) -> Iterator[str]:
+        """Yield file paths below root, skipping excluded directories."""
+        stack = [root]
+        while stack:
+            subdirs, files = self._scan_dir(stack.pop())
+            stack.extend(subdirs)
+            yield from files
+
+    @classmethod
+    def _get_walk_executor(cls) -> ThreadPoolExecutor:
+        """Return the thread pool shared by all parallel walks, creating it on
+        first use."""
+        with cls._walk_executor_lock:
+            if cls._walk_executor is None:
+                cls._walk_executor = ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1),
+                    thread_name_prefix="secure-env-walk",
+                )
+            return cls._walk_executor
+
+    def _iter_files_parallel(self, root: str) -> Iterator[str]:
+        """Yield file paths below root, walking each top-level subtree in a
+        thread pool.
+
+        The walk is bound by stat/getdents latency, during which the GIL is
+        released, so subtrees on slow filesystems are scanned concurrently.
+        """
+        subdirs, files = self._scan_dir(root)
+        yield from files
+
+        if not subdirs:
+            return
+
+        executor = self._get_walk_executor()
+        futures = [
+            executor.submit(lambda path: list(self._iter_files(path)), subdir)
+            for subdir in subdirs
+        ]
+        for future in futures:
+            yield from future.result()
+
     def get_project_files(self) -> List[Path]:
         """Get all files in project directory.
 
@@ -155,15 +337,15 @@ class SecureEnvironment:
         """
         files = []
         try:
-            for root, _, filenames in os.walk(self.project_root):
-                root_path = Path(root)
-                if self._is_excluded(root_path):
-                    continue
-
-                for filename in filenames:
-                    file_path = root_path / filename
-                    if self.is_file_allowed(file_path):
-                        files.append(file_path)
+            if self._is_excluded(self.project_root):
+                return files
+
+            walk = (
+                self._iter_files_parallel if self._parallel_walk else self._iter_files
+            )
+            for path_str in walk(str(self.project_root)):
+                if self._is_file_allowed_trusted(path_str):
+                    files.append(Path(path_str))
 
         except Exception as e:
             logger.error(f"Error getting project files: {e}")
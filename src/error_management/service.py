@@ -1,5 +1,7 @@
 """Error management service with Sentry integration."""
 
+import copy
+import functools
 import logging
 import logging.config  # Add explicit import for logging.config
 import os
@@ -15,6 +17,28 @@ from sentry_sdk.integrations.threading import ThreadingIntegration
 from .error_handler import error_handler
 from .monitor import start_monitoring
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached on its path and modification time."""
+    with open(path_str) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Return a private copy of a cached YAML file.
+
+    Callers such as logging.config.dictConfig mutate the dict they are given,
+    which must not leak into the cached parse.
+    """
+    return copy.deepcopy(_parse_yaml(path_str, mtime_ns))
+
 
 class ErrorManagementService:
     """Main error management service."""
@@ -32,9 +56,7 @@ class ErrorManagementService:
         """Load configuration."""
         try:
             config_path = self.project_path / "src" / "error_management" / "config.yaml"
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
-            return config
+            return _load_yaml(str(config_path), os.stat(config_path).st_mtime_ns)
         except Exception as e:
             self.logger.error("Failed to load config", error=str(e))
             return {}
@@ -151,5 +173,19 @@ class ErrorManagementService:
             raise
 
 
-# Create singleton instance
-error_management_service = ErrorManagementService()
+_service: Optional[ErrorManagementService] = None
+
+
+def get_service() -> ErrorManagementService:
+    """Get the shared service instance, creating it on first use."""
+    global _service
+    if _service is None:
+        _service = ErrorManagementService()
+    return _service
+
+
+def __getattr__(name: str) -> Any:
+    """Create the ``error_management_service`` singleton lazily on access."""
+    if name == "error_management_service":
+        return get_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,30 +1,44 @@
 """Simple error management system."""
 
+import collections
+import fileinput
 import logging
 import os
+import re
+import shutil
+import subprocess
 import sys
 import traceback
 from pathlib import Path
-from typing import Any, Callable, Dict
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("logs/error_handler.log"),
-    ],
-)
+from typing import Any, Callable, Dict, Optional
+
+# Configure logging; basicConfig is a no-op once the root logger has handlers,
+# so skip building (and opening) the handlers in that case
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler("logs/error_handler.log"),
+        ],
+    )
 logger = logging.getLogger(__name__)
 
+# Quoted module name in "No module named 'x'" style messages
+_MODULE_RE = re.compile(r"'([^']+)'")
+
 
 class SimpleErrorHandler:
     """Simple error handler with automatic fixes."""
 
     def __init__(self):
         """Initialize error handler."""
-        self.error_counts: Dict[str, int] = {}
+        self.error_counts: Dict[str, int] = collections.defaultdict(int)
+        # Running total, and the stats snapshot built from the counts; the
+        # snapshot is dropped whenever a new error is recorded
+        self._total_errors = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
         self.fixes: Dict[str, Callable] = {
             "ImportError": self._fix_import_error,
             "TypeError": self._fix_type_error,
@@ -35,28 +49,37 @@ class SimpleErrorHandler:
     def handle(self, func: Callable) -> Callable:
         """Decorator to handle errors in functions."""
 
+        # Bind lookups once so the wrapper does not repeat them on every error
+        fixes = self.fixes
+        counts = self.error_counts
+        log = logger
+
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 error_type = type(e).__name__
-                self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+                counts[error_type] += 1
+                self._total_errors += 1
+                self._stats_cache = None
 
-                # Log error
-                logger.error(f"Error in {func.__name__}: {str(e)}")
-                logger.error(f"Traceback:\n{traceback.format_exc()}")
+                # Log error; format_exc walks the whole frame chain, so only
+                # build the traceback when ERROR records are actually emitted
+                if log.isEnabledFor(logging.ERROR):
+                    log.error(f"Error in {func.__name__}: {str(e)}")
+                    log.error(f"Traceback:\n{traceback.format_exc()}")
 
                 # Try to fix error
-                fix_func = self.fixes.get(error_type)
+                fix_func = fixes.get(error_type)
                 if fix_func:
                     try:
-                        logger.info(f"Attempting to fix {error_type}")
+                        log.info(f"Attempting to fix {error_type}")
                         fix_func(e, func, args, kwargs)
-                        logger.info(f"Successfully fixed {error_type}")
+                        log.info(f"Successfully fixed {error_type}")
                         # Retry function
                         return func(*args, **kwargs)
                     except Exception as fix_error:
-                        logger.error(f"Failed to fix {error_type}: {str(fix_error)}")
+                        log.error(f"Failed to fix {error_type}: {str(fix_error)}")
 
                 raise
 
@@ -66,12 +89,28 @@ class SimpleErrorHandler:
         self, error: ImportError, func: Callable, args: tuple, kwargs: dict
     ) -> None:
         """Fix import errors."""
-        module = str(error).split("'")[1]
+        match = _MODULE_RE.search(str(error))
+        if not match:
+            raise ValueError(f"Could not determine missing module from: {error}")
+        module = match.group(1)
         logger.info(f"Attempting to install missing module: {module}")
         try:
-            import pip
-
-            pip.main(["install", module])
+            # Run pip in a child process: pip.main is not a supported API and
+            # importing pip into this interpreter is slow and leaks its state
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "pip",
+                    "install",
+                    "--disable-pip-version-check",
+                    "--no-input",
+                    module,
+                ],
+                check=True,
+                capture_output=True,
+                timeout=120,
+            )
             logger.info(f"Successfully installed {module}")
         except Exception as e:
             logger.error(f"Failed to install {module}: {str(e)}")
@@ -96,25 +135,22 @@ class SimpleErrorHandler:
         try:
             file_path = error.filename
             if file_path and os.path.exists(file_path):
-                with open(file_path, "r") as f:
-                    lines = f.readlines()
-
                 # Create backup
                 backup_path = Path("backups") / f"{Path(file_path).name}.bak"
                 backup_path.parent.mkdir(exist_ok=True)
-                with open(backup_path, "w") as f:
-                    f.writelines(lines)
-
-                # Fix common syntax issues
-                line = lines[error.lineno - 1]
-                fixed_line = line.rstrip() + "\n"  # Fix missing newline
-                if error.msg == "unexpected EOF while parsing":
-                    fixed_line = line.rstrip() + ")\n"  # Fix missing parenthesis
-
-                lines[error.lineno - 1] = fixed_line
-
-                with open(file_path, "w") as f:
-                    f.writelines(lines)
+                shutil.copyfile(file_path, backup_path)
+
+                # Stream the file and rewrite only the defective line instead
+                # of loading the whole file into memory
+                with fileinput.input(file_path, inplace=True) as f:
+                    for line in f:
+                        if f.filelineno() == error.lineno:
+                            # Fix common syntax issues
+                            line = line.rstrip() + "\n"  # Fix missing newline
+                            if error.msg == "unexpected EOF while parsing":
+                                # Fix missing parenthesis
+                                line = line.rstrip() + ")\n"
+                        sys.stdout.write(line)
 
                 logger.info(f"Fixed syntax error in {file_path}")
         except Exception as e:
@@ -128,12 +164,18 @@ class SimpleErrorHandler:
         logger.warning(f"No automatic fix available for: {str(error)}")
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get error statistics."""
-        return {
-            "error_counts": self.error_counts,
-            "total_errors": sum(self.error_counts.values()),
-            "unique_errors": len(self.error_counts),
-        }
+        """Get error statistics.
+
+        The same snapshot is returned until another error is recorded, so
+        callers must not modify it.
+        """
+        if self._stats_cache is None:
+            self._stats_cache = {
+                "error_counts": dict(self.error_counts),
+                "total_errors": self._total_errors,
+                "unique_errors": len(self.error_counts),
+            }
+        return self._stats_cache
 
 
 # Create singleton instance
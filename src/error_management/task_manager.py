@@ -1,22 +1,64 @@
 import asyncio
+import heapq
+import itertools
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Offset from the monotonic clock to wall-clock time, used to render task
+# timestamps as ISO strings on demand
+_MONOTONIC_TO_WALL = time.time() - time.monotonic()
+
 
 class TaskManager:
     def __init__(self):
         self.setup_logging()
         self.tasks = []
         self.task_lock = asyncio.Lock()
+        # Indexes over self.tasks: pending tasks by id() and open
+        # (pending/in_progress) linting tasks by file
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        # Creation sequence number of each task by id(), so pending tasks can
+        # be listed in self.tasks order; a task that is pended again goes to
+        # the end of _pending and clears _pending_in_order
+        self._created_seq: Dict[int, int] = {}
+        self._task_seq = itertools.count()
+        self._pending_in_order = True
+        self._open_linting: Dict[str, Dict[str, Any]] = {}
+        # Min-heap of (updated epoch, tie-breaker, task) for in_progress tasks
+        self._in_progress_heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._heap_counter = itertools.count()
+
+    @staticmethod
+    def format_timestamp(epoch: float) -> str:
+        """Format a task's monotonic timestamp as an ISO 8601 string.
+
+        Args:
+            epoch: Value of a task's ``created_at_epoch`` or ``updated_at_epoch``
+
+        Returns:
+            ISO 8601 wall-clock time
+        """
+        return datetime.fromtimestamp(_MONOTONIC_TO_WALL + epoch).isoformat()
 
     def setup_logging(self):
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
-        fh = logging.FileHandler(log_dir / "task_manager.log")
+        log_file = log_dir / "task_manager.log"
+
+        # Add handler only once per process, not once per instance
+        if any(
+            isinstance(h, logging.FileHandler)
+            and h.baseFilename == str(log_file.absolute())
+            for h in logger.handlers
+        ):
+            return
+
+        fh = logging.FileHandler(log_file)
         fh.setLevel(logging.INFO)
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -24,6 +66,28 @@ class TaskManager:
         fh.setFormatter(formatter)
         logger.addHandler(fh)
 
+    def _add_task(self, task: Dict[str, Any]) -> None:
+        """Append a new pending task and index it."""
+        self.tasks.append(task)
+        self._created_seq[id(task)] = next(self._task_seq)
+        self._pending[id(task)] = task
+
+    def _reindex_task(self, task: Dict[str, Any]) -> None:
+        """Update the status indexes after a task's status changed."""
+        if task["status"] == "pending":
+            if id(task) not in self._pending:
+                self._pending[id(task)] = task
+                self._pending_in_order = False
+        else:
+            self._pending.pop(id(task), None)
+
+        if task["type"] == "linting" and task["status"] not in [
+            "pending",
+            "in_progress",
+        ]:
+            if self._open_linting.get(task["file"]) is task:
+                del self._open_linting[task["file"]]
+
     async def create_error_fix_task(
         self, error: str, file: str, line: int, context: str
     ) -> Dict[str, Any]:
@@ -35,64 +99,82 @@ class TaskManager:
             "context": context,
             "status": "pending",
         }
-        self.tasks.append(task)
+        self._add_task(task)
         logger.info(f"Created error fix task for {file}:{line}")
         return task
 
     async def create_test_execution_task(self, test_file: str) -> Dict[str, Any]:
         task = {"type": "test_execution", "test_file": test_file, "status": "pending"}
-        self.tasks.append(task)
+        self._add_task(task)
         logger.info(f"Created test execution task for {test_file}")
         return task
 
     async def create_linting_task(self, file: str) -> Dict[str, Any]:
+        # Lock the check-then-append so concurrent callers share one task
         async with self.task_lock:
             # Check if there's already a pending/in-progress linting task for this file
-            existing_task = next(
-                (
-                    task
-                    for task in self.tasks
-                    if task["type"] == "linting"
-                    and task["file"] == file
-                    and task["status"] in ["pending", "in_progress"]
-                ),
-                None,
-            )
+            existing_task = self._open_linting.get(file)
             if existing_task:
                 return existing_task
 
+            now = time.monotonic()
             task = {
                 "type": "linting",
                 "file": file,
                 "status": "pending",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at_epoch": now,
+                "updated_at_epoch": now,
             }
-            self.tasks.append(task)
+            self._add_task(task)
+            self._open_linting[file] = task
             logger.info(f"Created linting task for {file}")
             return task
 
     async def get_pending_tasks(self) -> List[Dict[str, Any]]:
-        return [task for task in self.tasks if task["status"] == "pending"]
+        """Return pending tasks in creation order."""
+        if not self._pending_in_order:
+            # Only needed after a task went back to pending
+            self._pending = dict(
+                sorted(
+                    self._pending.items(), key=lambda item: self._created_seq[item[0]]
+                )
+            )
+            self._pending_in_order = True
+        return list(self._pending.values())
 
     async def update_task_status(self, task: Dict[str, Any], status: str):
-        async with self.task_lock:
-            task["status"] = status
-            task["updated_at"] = datetime.now().isoformat()
-            logger.info(f"Updated task status to {status} for {task['type']}")
+        # No await happens below, so the update cannot interleave with other
+        # coroutines on the event loop and needs no lock
+        task["status"] = status
+        task["updated_at_epoch"] = time.monotonic()
+        self._reindex_task(task)
+        if status == "in_progress":
+            heapq.heappush(
+                self._in_progress_heap,
+                (task["updated_at_epoch"], next(self._heap_counter), task),
+            )
+        logger.info(f"Updated task status to {status} for {task['type']}")
 
     async def cleanup_stale_tasks(self):
         """Clean up tasks that have been in_progress for too long"""
-        async with self.task_lock:
-            now = datetime.now()
-            for task in self.tasks:
-                if task["status"] == "in_progress":
-                    updated_at = datetime.fromisoformat(task["updated_at"])
-                    # If task has been in progress for more than 5 minutes, mark as failed
-                    if (now - updated_at).total_seconds() > 300:
-                        task["status"] = "failed"
-                        task["updated_at"] = now.isoformat()
-                        logger.warning(f"Marked stale task as failed: {task['type']}")
+        # Runs without awaiting, so no lock is needed (see update_task_status)
+        now = time.monotonic()
+        heap = self._in_progress_heap
+        # Entries are ordered by the time the task went in_progress, so only
+        # the stale prefix of the heap has to be inspected
+        while heap and now - heap[0][0] > 300:
+            updated_epoch, _, task = heapq.heappop(heap)
+            # Skip entries superseded by a later status update
+            if (
+                task["status"] != "in_progress"
+                or task["updated_at_epoch"] != updated_epoch
+            ):
+                continue
+            # If task has been in progress for more than 5 minutes, mark as failed
+            task["status"] = "failed"
+            task["updated_at_epoch"] = now
+            self._reindex_task(task)
+            logger.warning(f"Marked stale task as failed: {task['type']}")
 
 
 task_manager = TaskManager()
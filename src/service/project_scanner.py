@@ -1,20 +1,20 @@
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+import os
 from dataclasses import dataclass
-from typing import List
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple, Union
+
+from src.error_management.secure_environment import SecureEnvironment
 
 logger = logging.getLogger(__name__)
 
+# Number of fixes generated concurrently while the scan is still running
+FIX_WORKERS = 16
 
-@asynccontextmanager
-async def timeout_scanner(seconds: float):
-    """Context manager for scanner timeouts"""
-    try:
-        yield await asyncio.wait_for(asyncio.shield(asyncio.sleep(0)), timeout=seconds)
-    except asyncio.TimeoutError:
-        logger.warning(f"Scanner operation timed out after {seconds} seconds")
-        raise
+# Returns a fix for an issue, or None if there is none, e.g.
+# CursorAIInterface.get_fix_directive
+FixProvider = Callable[[dict], Awaitable[Optional[dict]]]
 
 
 @dataclass
@@ -24,13 +24,115 @@ class ScanResult:
 
 
 class ProjectScanner:
+    def __init__(
+        self,
+        project_root: Optional[Union[str, Path]] = None,
+        fix_provider: Optional[FixProvider] = None,
+    ):
+        """Initialize project scanner.
+
+        Args:
+            project_root: Root directory of the project to scan, defaulting
+                to the current directory
+            fix_provider: Coroutine function returning a fix for an issue;
+                without one, issues are found but no fixes are generated
+        """
+        self.project_root = Path(project_root) if project_root else Path.cwd()
+        self.fix_provider = fix_provider
+
     async def scan_with_fixes(self, timeout: float = 30.0) -> ScanResult:
         """Scan project and generate fixes with timeout"""
         try:
-            async with timeout_scanner(timeout):
-                issues = await self.scan_project()
-                fixes = await self.generate_fixes(issues)
+            # The deadline covers the scan and fix generation themselves
+            async with asyncio.timeout(timeout):
+                fixes = await self._scan_and_fix()
                 return ScanResult(status="completed", fixes=fixes)
         except asyncio.TimeoutError:
-            logger.error("Project scanning timed out")
+            logger.error(f"Project scanning timed out after {timeout} seconds")
             return ScanResult(status="timeout", fixes=[])
+
+    async def scan_project(self) -> AsyncIterator[dict]:
+        """Yield syntax errors in the project's Python files as they are found"""
+        files = await asyncio.to_thread(self._python_files)
+        for path in files:
+            issue = await asyncio.to_thread(self._check_file, path)
+            if issue is not None:
+                yield issue
+
+    async def generate_fix(self, issue: dict) -> Optional[dict]:
+        """Generate a fix for a single issue, or None if there is none"""
+        if self.fix_provider is None:
+            return None
+        return await self.fix_provider(issue)
+
+    def _python_files(self) -> List[str]:
+        """List Python files below the project root, skipping excluded dirs"""
+        files = []
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [
+                d for d in dirnames if d not in SecureEnvironment.EXCLUDED_DIRS
+            ]
+            files.extend(
+                os.path.join(dirpath, name)
+                for name in filenames
+                if name.endswith(".py")
+            )
+        return files
+
+    @staticmethod
+    def _check_file(path: str) -> Optional[dict]:
+        """Compile a file, returning its syntax error as an issue if any"""
+        try:
+            with open(path, "rb") as f:
+                source = f.read()
+            compile(source, path, "exec", dont_inherit=True)
+            return None
+        except SyntaxError as e:
+            return {
+                "file": path,
+                "line": e.lineno,
+                "type": type(e).__name__,
+                "message": e.msg,
+            }
+        except (OSError, ValueError) as e:
+            logger.error(f"Error scanning {path}: {e}")
+            return None
+
+    async def _scan_and_fix(self) -> List[dict]:
+        """Scan the project and generate fixes for the issues found.
+
+        Issues are queued as the scan yields them and fixed by a pool of
+        workers, so fix generation overlaps scanning instead of waiting for
+        the whole scan to finish. A failing worker cancels the scan and the
+        other workers, and its exception is re-raised.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=FIX_WORKERS * 4)
+        results: List[Tuple[int, dict]] = []
+
+        async def worker() -> None:
+            while True:
+                item = await queue.get()
+                # None tells the worker the scan is done
+                if item is None:
+                    return
+                index, issue = item
+                fix = await self.generate_fix(issue)
+                if fix is not None:
+                    results.append((index, fix))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(FIX_WORKERS):
+                    tg.create_task(worker())
+                index = 0
+                async for issue in self.scan_project():
+                    await queue.put((index, issue))
+                    index += 1
+                for _ in range(FIX_WORKERS):
+                    await queue.put(None)
+        except* Exception as group:
+            raise group.exceptions[0] from None
+
+        # Keep fixes in the order their issues were found
+        results.sort(key=lambda item: item[0])
+        return [fix for _, fix in results]
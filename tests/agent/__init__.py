@@ -11,6 +11,6 @@ Tests are organized into the following modules:
 The tests use pytest and pytest-asyncio for async testing support.
 """
 
-from .fixtures import cleanup_monitor, mock_services, monitor, test_project_path
+from .fixtures import cleanup_monitor, mock_services, monitor
 
-__all__ = ["test_project_path", "mock_services", "monitor", "cleanup_monitor"]
+__all__ = ["mock_services", "monitor", "cleanup_monitor"]
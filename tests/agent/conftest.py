@@ -0,0 +1,7 @@
+"""Fixtures for the agent tests."""
+
+from tests.agent.fixtures import (  # noqa: F401
+    cleanup_monitor,
+    mock_services,
+    monitor,
+)
@@ -3,91 +3,36 @@
 import asyncio
 from pathlib import Path
 from typing import AsyncGenerator, Tuple
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 
 from src.dashboard.monitoring.agent_monitor import AgentMonitor
-from src.error_management.memory_manager import MemoryManager
-from src.error_management.metrics import MetricsCollector, SystemMetrics
-from src.error_management.service import ErrorManagementService
+from tests.stubs import (
+    StubErrorService,
+    StubMemoryManager,
+    StubMetricsCollector,
+    default_metrics,
+)
 
 
 @pytest.fixture
-def test_project_path(tmp_path: Path) -> Path:
-    """Create a temporary project path for testing."""
-    project_dir = tmp_path / "test_project"
-    project_dir.mkdir(exist_ok=True)
-    return project_dir
-
-
-@pytest.fixture
-def mock_services(test_project_path: Path) -> Tuple[MagicMock, MagicMock, MagicMock]:
-    """Create mock services."""
-    memory_manager = MagicMock(spec=MemoryManager)
-    memory_manager.get_usage_metrics.return_value = {}
-    memory_manager.start_monitoring.return_value = None
-    memory_manager.stop_monitoring.return_value = None
-
-    metrics_collector = MagicMock(spec=MetricsCollector)
-    # Return initial metrics of 0, then update to 10.0 after delay
-    metrics_collector.collect_metrics.side_effect = [
-        SystemMetrics(
-            cpu_usage=0.0,
-            memory_usage=0.0,
-            response_time=0.1,
-            success_rate=100.0,
-            error_count=0,
-        ),
-        SystemMetrics(
-            cpu_usage=10.0,
-            memory_usage=20.0,
-            response_time=0.1,
-            success_rate=100.0,
-            error_count=0,
-        ),
-    ]
-
-    error_service = MagicMock(spec=ErrorManagementService)
-
-    # Mock async methods
-    async def mock_start() -> None:
-        pass
-
-    async def mock_stop() -> None:
-        pass
-
-    async def mock_get_errors() -> list:
-        return []
-
-    async def mock_scan_security() -> MagicMock:
-        mock = MagicMock()
-        mock.score = 100
-        mock.vulnerabilities = 0
-        return mock
-
-    async def mock_get_logs() -> list:
-        return []
-
-    async def mock_get_activities() -> list:
-        return []
-
-    error_service.start = mock_start
-    error_service.stop = mock_stop
-    error_service.get_errors = mock_get_errors
-    error_service.scan_security = mock_scan_security
-    error_service.get_logs = mock_get_logs
-    error_service.get_activities = mock_get_activities
-
-    return memory_manager, metrics_collector, error_service
+def mock_services(
+    test_project_path: Path,
+) -> Tuple[StubMemoryManager, StubMetricsCollector, StubErrorService]:
+    """Create stub services."""
+    return (
+        StubMemoryManager(),
+        StubMetricsCollector(default_metrics),
+        StubErrorService(),
+    )
 
 
 @pytest_asyncio.fixture
 async def monitor(
-    mock_services: Tuple[MagicMock, MagicMock, MagicMock],
+    mock_services: Tuple[StubMemoryManager, StubMetricsCollector, StubErrorService],
     test_project_path: Path,
-    event_loop: asyncio.AbstractEventLoop,
 ) -> AsyncGenerator[AgentMonitor, None]:
     """Create agent monitor instance with mocked dependencies."""
     memory_manager, metrics_collector, error_service = mock_services
@@ -98,7 +43,7 @@ async def monitor(
         return_value=(memory_manager, metrics_collector, error_service),
     ):
         monitor = AgentMonitor(project_path=test_project_path)
-        monitor._loop = event_loop
+        monitor._loop = asyncio.get_running_loop()
         yield monitor
 
 
@@ -106,11 +51,21 @@ async def monitor(
 async def cleanup_monitor(monitor: AgentMonitor) -> AsyncGenerator[None, None]:
     """Cleanup fixture that runs automatically after each test."""
     yield
-    # Cleanup
-    for agent_id in list(monitor._agents.keys()):
-        monitor.stop_agent(agent_id)
-        await asyncio.sleep(0.1)
-
-    # Wait for threads
-    for thread in monitor._monitors.values():
-        thread.join(timeout=1)
+    # stop_agent forgets each thread, so keep them to check below
+    threads = dict(monitor._monitors)
+
+    # Cleanup: stop all agents concurrently off the event loop, so pending
+    # security updates scheduled by the monitor threads can still run
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(monitor.stop_agent, agent_id)
+            for agent_id in list(monitor._agents.keys())
+        )
+    )
+
+    # Stopping wakes the threads, so they exit almost at once
+    await asyncio.gather(
+        *(asyncio.to_thread(thread.join, 0.1) for thread in threads.values())
+    )
+    for agent_id, thread in threads.items():
+        assert not thread.is_alive(), f"monitor thread for {agent_id} didn't stop"
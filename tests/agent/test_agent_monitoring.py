@@ -3,17 +3,14 @@
 import asyncio
 from datetime import datetime
 
-import pytest
-
 from src.dashboard.monitoring.agent_monitor import AgentMonitor
+from tests.stubs import StubMetricsCollector, endless_metrics, wait_for
 
 
-@pytest.mark.asyncio
 async def test_agent_metrics_update(monitor: AgentMonitor) -> None:
     """Test that agent metrics are updated over time."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Get initial metrics
     initial_metrics = monitor.get_agent_status(agent_id)["metrics"].copy()
@@ -21,7 +18,9 @@ async def test_agent_metrics_update(monitor: AgentMonitor) -> None:
     assert initial_metrics["memory_usage"] == 0.0
 
     # Wait for updates
-    await asyncio.sleep(0.5)
+    assert await wait_for(
+        lambda: monitor.get_agent_status(agent_id)["metrics"]["cpu_usage"] == 10.0
+    )
 
     # Get updated metrics
     updated_metrics = monitor.get_agent_status(agent_id)["metrics"]
@@ -33,15 +32,13 @@ async def test_agent_metrics_update(monitor: AgentMonitor) -> None:
     assert updated_metrics["active_time"] > initial_metrics["active_time"]
 
 
-@pytest.mark.asyncio
 async def test_agent_logs_generation(monitor: AgentMonitor) -> None:
     """Test agent log generation."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
-    # Wait for logs
-    await asyncio.sleep(0.5)
+    # Wait for the monitor thread to finish its collection ticks
+    assert await wait_for(lambda: monitor._stopped[agent_id].is_set())
 
     logs = monitor.get_agent_logs(agent_id)
     assert isinstance(logs, list)
@@ -56,12 +53,10 @@ async def test_agent_logs_generation(monitor: AgentMonitor) -> None:
     assert updated_logs[-1]["message"] == "Test log"
 
 
-@pytest.mark.asyncio
 async def test_agent_activities_tracking(monitor: AgentMonitor) -> None:
     """Test agent activity tracking."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Get initial activities (should have Agent Start activity)
     initial_activities = monitor.get_agent_activities(agent_id)
@@ -76,7 +71,7 @@ async def test_agent_activities_tracking(monitor: AgentMonitor) -> None:
         "status": "Success",
         "details": "Test activity",
     }
-    monitor._agents[agent_id]["activities"].insert(0, test_activity)
+    monitor._agents[agent_id]["activities"].appendleft(test_activity)
 
     # Get updated activities
     updated_activities = monitor.get_agent_activities(agent_id)
@@ -86,15 +81,14 @@ async def test_agent_activities_tracking(monitor: AgentMonitor) -> None:
     )  # Most recent activity should be Test
 
 
-@pytest.mark.asyncio
 async def test_security_monitoring(monitor: AgentMonitor) -> None:
     """Test security metrics monitoring."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
-    # Wait for security scan
-    await asyncio.sleep(0.5)
+    # Wait for the monitor thread to finish its ticks and security scans
+    assert await wait_for(lambda: monitor._stopped[agent_id].is_set())
+    await asyncio.sleep(0)  # Let the last scheduled scan run
 
     security = monitor.get_agent_security(agent_id)
     assert isinstance(security, dict)
@@ -103,12 +97,10 @@ async def test_security_monitoring(monitor: AgentMonitor) -> None:
     assert isinstance(security["last_scan"], datetime)
 
 
-@pytest.mark.asyncio
 async def test_container_monitoring(monitor: AgentMonitor) -> None:
     """Test container metrics monitoring."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     container = monitor.get_agent_container(agent_id)
     assert isinstance(container, dict)
@@ -119,12 +111,14 @@ async def test_container_monitoring(monitor: AgentMonitor) -> None:
     assert "resources" in container
 
 
-@pytest.mark.asyncio
 async def test_monitor_thread_safety(monitor: AgentMonitor) -> None:
     """Test thread safety of monitoring operations."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
+    # start_agent returns after the first tick; metrics update on the second
+    assert await wait_for(
+        lambda: monitor.get_agent_status(agent_id)["metrics"]["cpu_usage"] == 10.0
+    )
 
     async def update_metrics() -> None:
         for _ in range(5):
@@ -133,7 +127,7 @@ async def test_monitor_thread_safety(monitor: AgentMonitor) -> None:
                 metrics = status["metrics"]
                 assert metrics["cpu_usage"] == 10.0  # Updated metrics
                 assert metrics["memory_usage"] == 20.0
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(0.01)
 
     # Create multiple tasks accessing metrics
     tasks = [asyncio.create_task(update_metrics()) for _ in range(3)]
@@ -145,48 +139,51 @@ async def test_monitor_thread_safety(monitor: AgentMonitor) -> None:
     assert monitor.get_agent_status(agent_id)["status"] == "running"
 
 
-@pytest.mark.asyncio
 async def test_metrics_collection_frequency(monitor: AgentMonitor) -> None:
     """Test that metrics are collected at the expected frequency."""
     agent_id = "test_agent_1"
-    monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
+    # Keep collecting for as long as the test measures
+    monitor._metrics_collector = StubMetricsCollector(endless_metrics)
+    monitor.start_agent(agent_id)  # Returns after the first tick
+
+    def ticks() -> int:
+        return monitor._agents[agent_id]["_update_count"]
 
-    # Get initial timestamp
-    initial_time = datetime.now()
+    # Get initial tick count and timestamp
+    loop = asyncio.get_running_loop()
+    initial_ticks = ticks()
+    initial_time = loop.time()
     initial_metrics = monitor.get_agent_status(agent_id)["metrics"].copy()
 
     # Wait for multiple collection cycles
-    await asyncio.sleep(0.5)
+    assert await wait_for(lambda: ticks() >= initial_ticks + 5, timeout=2.0)
 
     # Get final metrics
+    final_ticks = ticks()
+    final_time = loop.time()
     final_metrics = monitor.get_agent_status(agent_id)["metrics"]
-    final_time = datetime.now()
 
     # Verify metrics were updated
     assert final_metrics["active_time"] > initial_metrics["active_time"]
 
-    # Calculate collection frequency
-    time_diff = (final_time - initial_time).total_seconds()
-    updates = final_metrics["active_time"] - initial_metrics["active_time"]
-    frequency = updates / time_diff
+    # Calculate collection frequency in ticks per second
+    frequency = (final_ticks - initial_ticks) / (final_time - initial_time)
 
     # Verify frequency is within expected range (approximately every 0.1 seconds)
     assert 8 <= frequency <= 12  # Allow some variance
 
 
-@pytest.mark.asyncio
 async def test_metrics_buffer_management(monitor: AgentMonitor) -> None:
     """Test that metrics history is properly managed."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
-    # Generate many log entries
-    for i in range(2000):  # More than buffer size
-        monitor._agents[agent_id]["logs"].append(
-            {"timestamp": datetime.now(), "level": "INFO", "message": f"Test log {i}"}
-        )
+    # Generate more log entries than the buffer holds
+    now = datetime.now()
+    monitor._agents[agent_id]["logs"].extend(
+        {"timestamp": now, "level": "INFO", "message": f"Test log {i}"}
+        for i in range(2000)
+    )
 
     # Verify buffer size is maintained
     logs = monitor.get_agent_logs(agent_id)
@@ -1,24 +1,27 @@
 """Tests for agent task management functionality."""
 
 import asyncio
+import itertools
 from datetime import datetime
 from typing import Any, Dict
 
-import pytest
-
 from src.dashboard.monitoring.agent_monitor import AgentMonitor
 
+# Keeps ids of tasks created within the same second distinct
+_task_counter = itertools.count()
+
 
 def create_test_task(task_type: str = "Run Tests") -> Dict[str, Any]:
     """Create a test task configuration."""
+    now = datetime.now()
     return {
-        "id": f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        "id": f"task_{now:%Y%m%d_%H%M%S}_{next(_task_counter)}",
         "type": task_type,
         "project_path": "/test/path",
         "priority": "Medium",
         "timeout": 30,
         "status": "pending",
-        "created_at": datetime.now(),
+        "created_at": now,
         "config": {
             "test_types": ["Unit Tests"],
             "test_pattern": "test_*.py",
@@ -27,7 +30,6 @@ def create_test_task(task_type: str = "Run Tests") -> Dict[str, Any]:
     }
 
 
-@pytest.mark.asyncio
 async def test_task_assignment(monitor: AgentMonitor) -> None:
     """Test assigning a task to an agent."""
     agent_id = "test_agent_1"
@@ -48,7 +50,6 @@ async def test_task_assignment(monitor: AgentMonitor) -> None:
     assert agent_status["tasks"][0]["id"] == task["id"]
 
 
-@pytest.mark.asyncio
 async def test_task_execution(monitor: AgentMonitor) -> None:
     """Test task execution flow."""
     agent_id = "test_agent_1"
@@ -73,7 +74,6 @@ async def test_task_execution(monitor: AgentMonitor) -> None:
         assert "results" in task_status
 
 
-@pytest.mark.asyncio
 async def test_multiple_task_handling(monitor: AgentMonitor) -> None:
     """Test handling multiple tasks for an agent."""
     agent_id = "test_agent_1"
@@ -106,7 +106,6 @@ async def test_multiple_task_handling(monitor: AgentMonitor) -> None:
     ]  # Tasks should be in order of assignment
 
 
-@pytest.mark.asyncio
 async def test_task_priority_handling(monitor: AgentMonitor) -> None:
     """Test task priority handling."""
     agent_id = "test_agent_1"
@@ -134,7 +133,6 @@ async def test_task_priority_handling(monitor: AgentMonitor) -> None:
         assert running_tasks[0]["priority"] == "High"
 
 
-@pytest.mark.asyncio
 async def test_task_timeout(monitor: AgentMonitor) -> None:
     """Test task timeout handling."""
     agent_id = "test_agent_1"
@@ -155,7 +153,6 @@ async def test_task_timeout(monitor: AgentMonitor) -> None:
     assert "timeout" in task_status.get("error", "").lower()
 
 
-@pytest.mark.asyncio
 async def test_task_error_handling(monitor: AgentMonitor) -> None:
     """Test error handling during task execution."""
     agent_id = "test_agent_1"
@@ -187,7 +184,6 @@ async def test_task_error_handling(monitor: AgentMonitor) -> None:
     assert len(error_logs) > 0
 
 
-@pytest.mark.asyncio
 async def test_task_progress_tracking(monitor: AgentMonitor) -> None:
     """Test task progress tracking."""
     agent_id = "test_agent_1"
@@ -211,7 +207,6 @@ async def test_task_progress_tracking(monitor: AgentMonitor) -> None:
         assert 0 <= task_status["progress"] <= 1
 
 
-@pytest.mark.asyncio
 async def test_task_results_handling(monitor: AgentMonitor) -> None:
     """Test handling of task results."""
     agent_id = "test_agent_1"
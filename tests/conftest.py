@@ -1,8 +1,14 @@
 """Test configuration and fixtures."""
 
+import asyncio
+import atexit
+import importlib.util
 import logging
+import logging.handlers
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -10,21 +16,116 @@ import pytest
 from src.error_management.simple_handler import error_handler
 from src.error_management.test_fixer import test_fixer
 
-# Configure logging
+# Configure logging; file records are buffered and written in batches (or
+# straight away for errors), and the log file is only opened on first write
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+# Under pytest-xdist each worker writes its own file rather than interleaving
+_worker = os.environ.get("PYTEST_XDIST_WORKER")
+_log_file = logging.FileHandler(
+    f"logs/test-{_worker}.log" if _worker else "logs/test.log", delay=True
+)
+# basicConfig only formats the handlers it is given, not the buffer's target
+_log_file.setFormatter(logging.Formatter(LOG_FORMAT))
+_file_handler = logging.handlers.MemoryHandler(
+    10000, flushLevel=logging.ERROR, target=_log_file
+)
+atexit.register(_file_handler.flush)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout), logging.FileHandler("logs/test.log")],
+    format=LOG_FORMAT,
+    handlers=[logging.StreamHandler(sys.stdout), _file_handler],
 )
 logger = logging.getLogger(__name__)
 
 
+def _numpy_linalg_tests_available() -> bool:
+    """Check for NumPy's bundled linalg tests without importing them."""
+    try:
+        return importlib.util.find_spec("numpy.linalg.tests") is not None
+    except ImportError:
+        return False
+
+
+# Don't even collect the matrix linalg tests when NumPy or its test suite is
+# not installed
+collect_ignore = [] if _numpy_linalg_tests_available() else ["test_matrix_linalg.py"]
+
+
+# Free space /dev/shm needs before temp directories are put there; Docker
+# gives containers only 64 MB by default
+RAMDISK_MIN_FREE = 512 * 1024 * 1024
+_ramdisk_basetemp = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    """Register the opt-in for temp directories on tmpfs."""
+    parser.addini(
+        "tmp_on_ramdisk",
+        type="bool",
+        default=False,
+        help="put pytest temp directories on /dev/shm when it has room",
+    )
+
+
+def pytest_configure(config):
+    """Put pytest temp directories on tmpfs when asked to and it has room."""
+    # An explicit --basetemp wins; pytest-xdist workers also arrive here with
+    # the basetemp the controller chose
+    if config.option.basetemp or not config.getini("tmp_on_ramdisk"):
+        return
+    shm = "/dev/shm"
+    if not (sys.platform.startswith("linux") and os.access(shm, os.W_OK)):
+        return
+    if shutil.disk_usage(shm).free < RAMDISK_MIN_FREE:
+        logger.info("Not enough free space on /dev/shm for temp directories")
+        return
+    # pytest wipes basetemp before use, so it must be a directory of our own
+    basetemp = tempfile.mkdtemp(prefix="pytest-", dir=shm)
+    config.option.basetemp = basetemp
+    config.stash[_ramdisk_basetemp] = basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the temp directories put on tmpfs, which would hold its memory."""
+    basetemp = config.stash.get(_ramdisk_basetemp, None)
+    if basetemp:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+class _EagerTaskLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy whose loops use eager tasks where available."""
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        loop = super().new_event_loop()
+        # Eager tasks run until their first real suspension inside create_task,
+        # saving a scheduler round-trip for the many short-lived test coroutines
+        if sys.version_info >= (3, 12):
+            loop.set_task_factory(asyncio.eager_task_factory)
+        return loop
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Policy pytest-asyncio uses to create the loops for async tests."""
+    return _EagerTaskLoopPolicy()
+
+
 @pytest.fixture(scope="session")
 def project_root() -> Path:
     """Get project root directory."""
     return Path(os.path.dirname(os.path.dirname(__file__)))
 
 
+@pytest.fixture(scope="session")
+def test_project_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary project path shared by the whole session.
+
+    Tests only record the path and never write to it, so one directory
+    serves every test; tests that create files use tmp_path instead.
+    """
+    return tmp_path_factory.mktemp("test_project")
+
+
 @pytest.fixture(scope="session")
 def error_management(project_root):
     """Initialize error management system for tests."""
@@ -57,7 +158,7 @@ def error_management(project_root):
                 logger.info(f"  - {fix['description']}")
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def auto_error_management(error_management):
     """Automatically enable error management for all tests."""
     yield error_management
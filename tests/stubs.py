@@ -0,0 +1,133 @@
+"""Lightweight service stubs and wait helpers for agent monitor tests.
+
+MagicMock(spec=...) introspects the specced class on every construction;
+these stubs implement only the methods AgentMonitor calls.
+"""
+
+import asyncio
+import itertools
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from src.error_management.metrics import SystemMetrics
+
+# FAST_TESTS=0 falls back to the fixed sleeps instead of waiting on events
+FAST_TESTS = os.environ.get("FAST_TESTS", "1") != "0"
+
+
+async def wait_for(pred, timeout: float = 1.0, step: float = 0.005) -> bool:
+    """Poll pred until it returns True or the timeout expires.
+
+    Lets tests continue as soon as the monitor thread has published what they
+    check instead of sleeping for a worst-case interval.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not pred():
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(step)
+    return True
+
+
+async def wait_for_event(event: threading.Event, fallback: float = 0.1) -> None:
+    """Wait until a monitor thread signals the event."""
+    if FAST_TESTS:
+        await asyncio.to_thread(event.wait, 1.0)
+    else:
+        await asyncio.sleep(fallback)
+
+
+class StubMemoryManager:
+    """Stand-in for MemoryManager."""
+
+    def start_monitoring(self) -> None:
+        pass
+
+    def stop_monitoring(self) -> None:
+        pass
+
+    def get_usage_metrics(self) -> Dict[str, Any]:
+        return {}
+
+
+class StubMetricsCollector:
+    """Stand-in for MetricsCollector returning a fixed sequence of metrics.
+
+    AgentMonitor shares one collector between all agents, each polling it
+    from its own thread, so every calling thread gets its own run of the
+    sequence from values(). A run raises StopIteration once exhausted, like
+    a MagicMock with a list side_effect.
+    """
+
+    def __init__(self, values: Callable[[], Iterable[SystemMetrics]]):
+        self._values = values
+        self._local = threading.local()
+
+    def collect_metrics(self) -> SystemMetrics:
+        it = getattr(self._local, "iter", None)
+        if it is None:
+            it = self._local.iter = iter(self._values())
+        return next(it)
+
+
+class StubSecurityScan:
+    """Result of StubErrorService.scan_security."""
+
+    score = 100
+    vulnerabilities = 0
+
+
+class StubErrorService:
+    """Stand-in for ErrorManagementService with no-op async methods."""
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def get_errors(self) -> List[Any]:
+        return []
+
+    async def scan_security(self) -> StubSecurityScan:
+        return StubSecurityScan()
+
+    async def get_logs(self) -> List[Any]:
+        return []
+
+    async def get_activities(self) -> List[Any]:
+        return []
+
+
+# Monitors only read the metrics they collect, so the snapshots are shared
+# rather than rebuilt for every test
+INITIAL_METRICS = SystemMetrics(
+    cpu_usage=0.0,
+    memory_usage=0.0,
+    response_time=0.1,
+    success_rate=100.0,
+    error_count=0,
+)
+UPDATED_METRICS = SystemMetrics(
+    cpu_usage=10.0,
+    memory_usage=20.0,
+    response_time=0.1,
+    success_rate=100.0,
+    error_count=0,
+)
+
+
+def default_metrics() -> List[SystemMetrics]:
+    """Initial metrics of 0, then updated metrics of 10.0.
+
+    Pass the function itself to StubMetricsCollector so each agent gets both.
+    """
+    return [INITIAL_METRICS, UPDATED_METRICS]
+
+
+def endless_metrics() -> Iterator[SystemMetrics]:
+    """Initial metrics of 0, then updated metrics of 10.0 for as long as
+    they are collected."""
+    return itertools.chain([INITIAL_METRICS], itertools.repeat(UPDATED_METRICS))
@@ -1,19 +1,16 @@
 """Tests for agent lifecycle management."""
 
-import asyncio
 from datetime import datetime
 
-import pytest
-
 from src.dashboard.monitoring.agent_monitor import AgentMonitor
+from tests.stubs import wait_for, wait_for_event
 
 
-@pytest.mark.asyncio
 async def test_start_agent(monitor: AgentMonitor) -> None:
     """Test starting an agent."""
     agent_id = "test_agent_1"
     success = monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for async operations
+    await wait_for_event(monitor._started[agent_id])  # Wait for first tick
 
     assert success is True
     assert agent_id in monitor._agents
@@ -36,27 +33,25 @@ async def test_start_agent(monitor: AgentMonitor) -> None:
     assert monitor._monitors[agent_id].is_alive()
 
 
-@pytest.mark.asyncio
 async def test_stop_agent(monitor: AgentMonitor) -> None:
     """Test stopping an agent."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start to complete
+    await wait_for_event(monitor._started[agent_id])  # Wait for start to complete
 
     success = monitor.stop_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for stop to complete
+    await wait_for_event(monitor._stopped[agent_id])  # Wait for stop to complete
 
     assert success is True
     assert monitor._agents[agent_id]["status"] == "stopped"
     assert agent_id not in monitor._monitors
 
 
-@pytest.mark.asyncio
 async def test_agent_cleanup(monitor: AgentMonitor) -> None:
     """Test proper cleanup of agent resources."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
+    await wait_for_event(monitor._started[agent_id])  # Wait for start
 
     # Get monitor thread
     thread = monitor._monitors[agent_id]
@@ -64,7 +59,7 @@ async def test_agent_cleanup(monitor: AgentMonitor) -> None:
 
     # Stop agent
     monitor.stop_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for stop
+    await wait_for_event(monitor._stopped[agent_id])  # Wait for stop
 
     # Verify thread stopped
     thread.join(timeout=1)
@@ -72,7 +67,6 @@ async def test_agent_cleanup(monitor: AgentMonitor) -> None:
     assert agent_id not in monitor._monitors
 
 
-@pytest.mark.asyncio
 async def test_concurrent_agents(monitor: AgentMonitor) -> None:
     """Test monitoring multiple agents concurrently."""
     agent_ids = [f"test_agent_{i}" for i in range(3)]
@@ -81,10 +75,15 @@ async def test_concurrent_agents(monitor: AgentMonitor) -> None:
     for agent_id in agent_ids:
         success = monitor.start_agent(agent_id)
         assert success is True
-        await asyncio.sleep(0.1)  # Wait for each start
-
-    # Wait for updates
-    await asyncio.sleep(0.5)
+        await wait_for_event(monitor._started[agent_id])  # Wait for each start
+
+    # Wait for every agent's second tick
+    assert await wait_for(
+        lambda: all(
+            monitor.get_agent_status(agent_id)["metrics"]["cpu_usage"] == 10.0
+            for agent_id in agent_ids
+        )
+    )
 
     # Verify all agents are monitored
     for agent_id in agent_ids:
@@ -1,5 +1,6 @@
 """Tests for agent metrics and monitoring."""
 
+import copy
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -15,53 +16,54 @@ from src.error_management.service import ErrorManagementService
 class MockSessionState:
     """Mock Streamlit session state."""
 
+    __slots__ = (
+        "agents",
+        "agent_logs",
+        "agent_metrics",
+        "agent_activities",
+        "agent_security",
+    )
+
     def __init__(self):
-        self._data = {
-            "agents": [
-                {
-                    "id": "test_agent_1",
-                    "name": "Test Agent",
-                    "type": "Error Detection",
-                    "status": "running",
-                }
-            ],
-            "agent_logs": {"test_agent_1": []},
-            "agent_metrics": {
-                "test_agent_1": {
-                    "errors_fixed": 0,
-                    "success_rate": 100,
-                    "avg_response_time": 0,
-                    "active_time": 0,
-                }
-            },
-            "agent_activities": {"test_agent_1": []},
-            "agent_security": {
-                "test_agent_1": {
-                    "permissions": ["read", "write", "execute"],
-                    "vulnerabilities_detected": 0,
-                    "security_score": 100,
-                    "last_security_scan": datetime.now(),
-                }
-            },
+        self.agents = [
+            {
+                "id": "test_agent_1",
+                "name": "Test Agent",
+                "type": "Error Detection",
+                "status": "running",
+            }
+        ]
+        self.agent_logs = {"test_agent_1": []}
+        self.agent_metrics = {
+            "test_agent_1": {
+                "errors_fixed": 0,
+                "success_rate": 100,
+                "avg_response_time": 0,
+                "active_time": 0,
+            }
+        }
+        self.agent_activities = {"test_agent_1": []}
+        self.agent_security = {
+            "test_agent_1": {
+                "permissions": ["read", "write", "execute"],
+                "vulnerabilities_detected": 0,
+                "security_score": 100,
+                "last_security_scan": datetime.now(),
+            }
         }
 
-    def __getattr__(self, name):
-        return self._data.get(name)
+    def __contains__(self, key):
+        return hasattr(self, key)
 
-    def __setattr__(self, name, value):
-        if name == "_data":
-            super().__setattr__(name, value)
-        else:
-            self._data[name] = value
 
-    def __contains__(self, key):
-        return key in self._data
+# Built once and deep-copied per test
+_SESSION_STATE_TEMPLATE = MockSessionState()
 
 
 @pytest.fixture
 def mock_session_state(monkeypatch):
     """Mock Streamlit session state."""
-    mock_state = MockSessionState()
+    mock_state = copy.deepcopy(_SESSION_STATE_TEMPLATE)
     monkeypatch.setattr(st, "session_state", mock_state)
     return mock_state
 
@@ -104,7 +106,6 @@ def metrics_collector(mock_session_state, test_project_path: Path):
     return AgentMetricsCollector(memory_manager, error_service)
 
 
-@pytest.mark.asyncio
 async def test_update_agent_metrics(metrics_collector, mock_session_state):
     """Test agent metrics update."""
     agent_id = "test_agent_1"
@@ -120,7 +121,6 @@ async def test_update_agent_metrics(metrics_collector, mock_session_state):
     assert updated_metrics["active_time"] > initial_metrics["active_time"]
 
 
-@pytest.mark.asyncio
 async def test_log_agent_activity(metrics_collector, mock_session_state):
     """Test agent activity logging."""
     agent_id = "test_agent_1"
@@ -143,7 +143,6 @@ async def test_log_agent_activity(metrics_collector, mock_session_state):
     assert isinstance(latest_activity["timestamp"], datetime)
 
 
-@pytest.mark.asyncio
 async def test_get_agent_metrics(metrics_collector, mock_session_state):
     """Test getting agent metrics."""
     agent_id = "test_agent_1"
@@ -156,7 +155,6 @@ async def test_get_agent_metrics(metrics_collector, mock_session_state):
     assert "success_rate" in metrics
 
 
-@pytest.mark.asyncio
 async def test_get_agent_security(metrics_collector, mock_session_state):
     """Test getting agent security metrics."""
     agent_id = "test_agent_1"
@@ -168,7 +166,6 @@ async def test_get_agent_security(metrics_collector, mock_session_state):
     assert isinstance(security["permissions"], list)
 
 
-@pytest.mark.asyncio
 async def test_get_agent_logs(metrics_collector, mock_session_state):
     """Test getting agent logs."""
     agent_id = "test_agent_1"
@@ -185,7 +182,6 @@ async def test_get_agent_logs(metrics_collector, mock_session_state):
     assert "message" in logs[0]
 
 
-@pytest.mark.asyncio
 async def test_get_agent_activities(metrics_collector, mock_session_state):
     """Test getting agent activities."""
     agent_id = "test_agent_1"
@@ -208,7 +204,6 @@ async def test_get_agent_activities(metrics_collector, mock_session_state):
     assert "details" in activities[0]
 
 
-@pytest.mark.asyncio
 async def test_get_performance_metrics(metrics_collector):
     """Test getting performance metrics."""
     metrics = metrics_collector.get_performance_metrics()
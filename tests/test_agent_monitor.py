@@ -3,123 +3,74 @@
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 
 from src.dashboard.monitoring.agent_monitor import AgentMonitor
 from src.error_management.factory import ServiceFactory
-from src.error_management.memory_manager import MemoryManager
-from src.error_management.metrics import MetricsCollector, SystemMetrics
-from src.error_management.service import ErrorManagementService
-
-
-@pytest.fixture
-def test_project_path(tmp_path: Path) -> Path:
-    """Create a temporary project path for testing."""
-    project_dir = tmp_path / "test_project"
-    project_dir.mkdir(exist_ok=True)
-    return project_dir
-
-
-@pytest.fixture
-def mock_services(test_project_path: Path):
-    """Create mock services."""
-    memory_manager = MagicMock(spec=MemoryManager)
-    memory_manager.get_usage_metrics.return_value = {}
-    memory_manager.start_monitoring.return_value = None
-    memory_manager.stop_monitoring.return_value = None
-
-    metrics_collector = MagicMock(spec=MetricsCollector)
-    # Return initial metrics of 0, then update to 10.0 after delay
-    metrics_collector.collect_metrics.side_effect = [
-        SystemMetrics(
-            cpu_usage=0.0,
-            memory_usage=0.0,
-            response_time=0.1,
-            success_rate=100.0,
-            error_count=0,
-        ),
-        SystemMetrics(
-            cpu_usage=10.0,
-            memory_usage=20.0,
-            response_time=0.1,
-            success_rate=100.0,
-            error_count=0,
-        ),
-    ]
-
-    error_service = MagicMock(spec=ErrorManagementService)
-
-    # Mock async methods
-    async def mock_start() -> None:
-        pass
-
-    async def mock_stop() -> None:
-        pass
-
-    async def mock_get_errors() -> list:
-        return []
-
-    async def mock_scan_security() -> MagicMock:
-        mock = MagicMock()
-        mock.score = 100
-        mock.vulnerabilities = 0
-        return mock
-
-    async def mock_get_logs() -> list:
-        return []
-
-    async def mock_get_activities() -> list:
-        return []
-
-    error_service.start = mock_start
-    error_service.stop = mock_stop
-    error_service.get_errors = mock_get_errors
-    error_service.scan_security = mock_scan_security
-    error_service.get_logs = mock_get_logs
-    error_service.get_activities = mock_get_activities
-
-    return memory_manager, metrics_collector, error_service
+from tests.stubs import (
+    StubErrorService,
+    StubMemoryManager,
+    StubMetricsCollector,
+    default_metrics,
+    wait_for,
+)
+
+
+def make_services():
+    """Create a fresh set of stub services for one monitor."""
+    return (
+        StubMemoryManager(),
+        StubMetricsCollector(default_metrics),
+        StubErrorService(),
+    )
 
 
-@pytest_asyncio.fixture
-async def monitor(mock_services, test_project_path: Path, event_loop) -> AgentMonitor:
-    """Create agent monitor instance with mocked dependencies."""
-    memory_manager, metrics_collector, error_service = mock_services
+@pytest.fixture(scope="module", autouse=True)
+def patch_service_factory():
+    """Make the service factory return stub services for the whole module.
+
+    The patch is started once per module rather than entered and exited around
+    every monitor; each call still gets its own stubs, since the metrics
+    collector is consumed as the monitor runs.
+    """
+    patcher = patch.object(
+        ServiceFactory, "create_all_services", side_effect=make_services
+    )
+    patcher.start()
+    yield
+    patcher.stop()
 
-    # Mock the factory to return our mock services
-    with patch.object(
-        ServiceFactory,
-        "create_all_services",
-        return_value=(memory_manager, metrics_collector, error_service),
-    ):
-        monitor = AgentMonitor(project_path=test_project_path)
-        monitor._loop = event_loop
-        return monitor
+
+@pytest_asyncio.fixture
+async def monitor(test_project_path: Path) -> AgentMonitor:
+    """Create agent monitor instance with stubbed dependencies."""
+    monitor = AgentMonitor(project_path=test_project_path)
+    monitor._loop = asyncio.get_running_loop()
+    return monitor
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def cleanup_monitor(monitor: AgentMonitor):
     """Cleanup fixture that runs automatically after each test."""
     yield
-    # Cleanup
+    # Cleanup; stop_agent forgets each thread, so keep them to check below
+    threads = dict(monitor._monitors)
     for agent_id in list(monitor._agents.keys()):
         monitor.stop_agent(agent_id)
-        await asyncio.sleep(0.1)
 
-    # Wait for threads
-    for thread in monitor._monitors.values():
-        thread.join(timeout=1)
+    # Stopping wakes the threads, so they exit almost at once
+    for agent_id, thread in threads.items():
+        thread.join(timeout=0.1)
+        assert not thread.is_alive(), f"monitor thread for {agent_id} didn't stop"
 
 
-@pytest.mark.asyncio
 async def test_start_agent(monitor: AgentMonitor) -> None:
     """Test starting an agent."""
     agent_id = "test_agent_1"
     success = monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for async operations
 
     assert success is True
     assert agent_id in monitor._agents
@@ -142,27 +93,24 @@ async def test_start_agent(monitor: AgentMonitor) -> None:
     assert monitor._monitors[agent_id].is_alive()
 
 
-@pytest.mark.asyncio
 async def test_stop_agent(monitor: AgentMonitor) -> None:
     """Test stopping an agent."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start to complete
 
     success = monitor.stop_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for stop to complete
+    # stop_agent joins the thread; it has signalled its exit by now
+    assert await wait_for(lambda: monitor._stopped[agent_id].is_set())
 
     assert success is True
     assert monitor._agents[agent_id]["status"] == "stopped"
     assert agent_id not in monitor._monitors
 
 
-@pytest.mark.asyncio
 async def test_agent_metrics_update(monitor: AgentMonitor) -> None:
     """Test that agent metrics are updated over time."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Get initial metrics
     initial_metrics = monitor.get_agent_status(agent_id)["metrics"].copy()
@@ -170,7 +118,9 @@ async def test_agent_metrics_update(monitor: AgentMonitor) -> None:
     assert initial_metrics["memory_usage"] == 0.0
 
     # Wait for updates
-    await asyncio.sleep(0.5)
+    assert await wait_for(
+        lambda: monitor.get_agent_status(agent_id)["metrics"]["cpu_usage"] == 10.0
+    )
 
     # Get updated metrics
     updated_metrics = monitor.get_agent_status(agent_id)["metrics"]
@@ -182,15 +132,13 @@ async def test_agent_metrics_update(monitor: AgentMonitor) -> None:
     assert updated_metrics["active_time"] > initial_metrics["active_time"]
 
 
-@pytest.mark.asyncio
 async def test_agent_logs_generation(monitor: AgentMonitor) -> None:
     """Test agent log generation."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
-    # Wait for logs
-    await asyncio.sleep(0.5)
+    # Wait for the monitor thread to finish its collection ticks
+    assert await wait_for(lambda: monitor._stopped[agent_id].is_set())
 
     logs = monitor.get_agent_logs(agent_id)
     assert isinstance(logs, list)
@@ -205,12 +153,10 @@ async def test_agent_logs_generation(monitor: AgentMonitor) -> None:
     assert updated_logs[-1]["message"] == "Test log"
 
 
-@pytest.mark.asyncio
 async def test_agent_activities_tracking(monitor: AgentMonitor) -> None:
     """Test agent activity tracking."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Get initial activities (should have Agent Start activity)
     initial_activities = monitor.get_agent_activities(agent_id)
@@ -225,7 +171,7 @@ async def test_agent_activities_tracking(monitor: AgentMonitor) -> None:
         "status": "Success",
         "details": "Test activity",
     }
-    monitor._agents[agent_id]["activities"].insert(0, test_activity)
+    monitor._agents[agent_id]["activities"].appendleft(test_activity)
 
     # Get updated activities
     updated_activities = monitor.get_agent_activities(agent_id)
@@ -235,15 +181,14 @@ async def test_agent_activities_tracking(monitor: AgentMonitor) -> None:
     )  # Most recent activity should be Test
 
 
-@pytest.mark.asyncio
 async def test_security_monitoring(monitor: AgentMonitor) -> None:
     """Test security metrics monitoring."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
-    # Wait for security scan
-    await asyncio.sleep(0.5)
+    # Wait for the monitor thread to finish its ticks and security scans
+    assert await wait_for(lambda: monitor._stopped[agent_id].is_set())
+    await asyncio.sleep(0)  # Let the last scheduled scan run
 
     security = monitor.get_agent_security(agent_id)
     assert isinstance(security, dict)
@@ -252,12 +197,10 @@ async def test_security_monitoring(monitor: AgentMonitor) -> None:
     assert isinstance(security["last_scan"], datetime)
 
 
-@pytest.mark.asyncio
 async def test_container_monitoring(monitor: AgentMonitor) -> None:
     """Test container metrics monitoring."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     container = monitor.get_agent_container(agent_id)
     assert isinstance(container, dict)
@@ -268,7 +211,6 @@ async def test_container_monitoring(monitor: AgentMonitor) -> None:
     assert "resources" in container
 
 
-@pytest.mark.asyncio
 async def test_concurrent_agents(monitor: AgentMonitor) -> None:
     """Test monitoring multiple agents concurrently."""
     agent_ids = [f"test_agent_{i}" for i in range(3)]
@@ -277,10 +219,14 @@ async def test_concurrent_agents(monitor: AgentMonitor) -> None:
     for agent_id in agent_ids:
         success = monitor.start_agent(agent_id)
         assert success is True
-        await asyncio.sleep(0.1)  # Wait for each start
 
-    # Wait for updates
-    await asyncio.sleep(0.5)
+    # Wait for every agent's second tick
+    assert await wait_for(
+        lambda: all(
+            monitor.get_agent_status(agent_id)["metrics"]["cpu_usage"] == 10.0
+            for agent_id in agent_ids
+        )
+    )
 
     # Verify all agents are monitored
     for agent_id in agent_ids:
@@ -292,12 +238,10 @@ async def test_concurrent_agents(monitor: AgentMonitor) -> None:
         assert status["metrics"]["success_rate"] == 100.0
 
 
-@pytest.mark.asyncio
 async def test_agent_cleanup(monitor: AgentMonitor) -> None:
     """Test proper cleanup of agent resources."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Get monitor thread
     thread = monitor._monitors[agent_id]
@@ -305,7 +249,7 @@ async def test_agent_cleanup(monitor: AgentMonitor) -> None:
 
     # Stop agent
     monitor.stop_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for stop
+    assert await wait_for(lambda: monitor._stopped[agent_id].is_set())
 
     # Verify thread stopped
     thread.join(timeout=1)
@@ -313,12 +257,14 @@ async def test_agent_cleanup(monitor: AgentMonitor) -> None:
     assert agent_id not in monitor._monitors
 
 
-@pytest.mark.asyncio
 async def test_monitor_thread_safety(monitor: AgentMonitor) -> None:
     """Test thread safety of monitoring operations."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
+    # start_agent returns after the first tick; metrics update on the second
+    assert await wait_for(
+        lambda: monitor.get_agent_status(agent_id)["metrics"]["cpu_usage"] == 10.0
+    )
 
     async def update_metrics() -> None:
         for _ in range(5):
@@ -327,7 +273,7 @@ async def test_monitor_thread_safety(monitor: AgentMonitor) -> None:
                 metrics = status["metrics"]
                 assert metrics["cpu_usage"] == 10.0  # Updated metrics
                 assert metrics["memory_usage"] == 20.0
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(0.01)
 
     # Create multiple tasks accessing metrics
     tasks = [asyncio.create_task(update_metrics()) for _ in range(3)]
@@ -2,13 +2,13 @@
 Integration tests for Dashboard functionality
 """
 
-import asyncio
+import itertools
 import os
 import sys
 from datetime import datetime
-from unittest.mock import MagicMock
 
 import pytest
+import pytest_asyncio
 
 # Add project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -16,67 +16,67 @@ sys.path.insert(0, project_root)
 
 from src.dashboard.services.dashboard_service import DashboardService
 from src.error_management.error_manager import ErrorManager, ErrorModel
-from src.error_management.memory_manager import MemoryManager
-from src.error_management.metrics import MetricsCollector, SystemMetrics
+from src.error_management.metrics import SystemMetrics
+from tests.stubs import StubMemoryManager, StubMetricsCollector
 
+SAMPLE_METRICS = SystemMetrics(
+    memory_usage=50.0,
+    cpu_usage=25.0,
+    response_time=0.1,
+    error_count=0,
+    success_rate=100.0,
+)
 
-@pytest.fixture
-def error_manager(tmp_path):
+# The service fixtures below live for the whole session, so every test must
+# run on the session's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(scope="session")
+def error_manager(tmp_path_factory):
     """Create an error manager instance."""
-    manager = ErrorManager(project_root=tmp_path)
-    # Mock memory manager
-    manager._memory_manager.start_monitoring = MagicMock()
-    manager._memory_manager.stop_monitoring = MagicMock()
-    manager._memory_manager.get_usage_metrics = MagicMock(return_value={})
+    manager = ErrorManager(project_root=tmp_path_factory.mktemp("dash"))
+    manager._memory_manager = StubMemoryManager()
     return manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def memory_manager():
-    """Create a memory manager instance."""
-    manager = MemoryManager()
-    manager.start_monitoring = MagicMock()
-    manager.stop_monitoring = MagicMock()
-    manager.get_usage_metrics = MagicMock(return_value={})
-    return manager
+    """Create a stub memory manager."""
+    return StubMemoryManager()
 
 
-@pytest.fixture
-def metrics_collector(memory_manager):
-    """Create a metrics collector instance."""
-    collector = MetricsCollector(memory_manager=memory_manager)
-    collector.collect_metrics = MagicMock(
-        return_value=SystemMetrics(
-            memory_usage=50.0,
-            cpu_usage=25.0,
-            response_time=0.1,
-            error_count=0,
-            success_rate=100.0,
-        )
-    )
-    return collector
+@pytest.fixture(scope="session")
+def metrics_collector():
+    """Create a stub metrics collector that always returns the same sample."""
+    return StubMetricsCollector(lambda: itertools.repeat(SAMPLE_METRICS))
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def dashboard_service(error_manager, metrics_collector):
-    """Create and start a dashboard service instance."""
+    """Create and start a dashboard service shared by all tests."""
     service = DashboardService(
         error_manager=error_manager, metrics_collector=metrics_collector
     )
+    # start() awaits the initial state update, so the service is ready here
     await service.start()
     try:
-        await asyncio.sleep(0.1)  # Allow service to initialize
-        return service
+        yield service
     finally:
         await service.stop()
 
 
+@pytest.fixture(autouse=True)
+def reset_state(error_manager, dashboard_service):
+    """Clear errors and notifications left by the previous test."""
+    error_manager.errors.clear()
+    dashboard_service.clear_notifications()
+
+
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_dashboard_error_integration(dashboard_service, error_manager, tmp_path):
     """Test integration between dashboard and error management system."""
-    # Get the actual service instance
-    service = await dashboard_service
+    service = dashboard_service
 
     # Create test error
     test_file = tmp_path / "test.py"
@@ -93,9 +93,6 @@ async def test_dashboard_error_integration(dashboard_service, error_manager, tmp
     # Add error through error manager
     await error_manager.add_error_async(error)
 
-    # Allow dashboard to update
-    await asyncio.sleep(0.1)
-
     # Verify error appears in dashboard
     dashboard_errors = await service.get_active_errors()
     assert len(dashboard_errors) > 0
@@ -103,18 +100,13 @@ async def test_dashboard_error_integration(dashboard_service, error_manager, tmp
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_dashboard_metrics_integration(
     dashboard_service, memory_manager, metrics_collector
 ):
     """Test integration between dashboard and system metrics."""
-    # Get the actual service instance
-    service = await dashboard_service
-
-    # Allow dashboard to collect initial metrics
-    await asyncio.sleep(0.1)
+    service = dashboard_service
 
-    # Get metrics from dashboard
+    # Get metrics from dashboard; the getters refresh state before returning
     dashboard_metrics = await service.get_system_metrics()
 
     # Verify metrics are present
@@ -130,11 +122,9 @@ async def test_dashboard_metrics_integration(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_dashboard_notification_flow(dashboard_service, error_manager, tmp_path):
     """Test end-to-end notification flow."""
-    # Get the actual service instance
-    service = await dashboard_service
+    service = dashboard_service
 
     # Create and process an error that should trigger a notification
     test_file = tmp_path / "test.py"
@@ -169,11 +159,9 @@ async def test_dashboard_notification_flow(dashboard_service, error_manager, tmp
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_dashboard_realtime_updates(dashboard_service, error_manager, tmp_path):
     """Test real-time updates in dashboard."""
-    # Get the actual service instance
-    service = await dashboard_service
+    service = dashboard_service
 
     # Create initial error
     test_file = tmp_path / "test.py"
@@ -190,9 +178,6 @@ async def test_dashboard_realtime_updates(dashboard_service, error_manager, tmp_
     # Add first error
     await error_manager.add_error_async(error1)
 
-    # Allow dashboard to update
-    await asyncio.sleep(0.1)
-
     # Get initial dashboard state
     initial_errors = await service.get_active_errors()
     initial_count = len(initial_errors)
@@ -207,24 +192,15 @@ async def test_dashboard_realtime_updates(dashboard_service, error_manager, tmp_
     )
     await error_manager.add_error_async(error2)
 
-    # Allow dashboard to update
-    await asyncio.sleep(0.1)
-
     # Verify dashboard updates
     updated_errors = await service.get_active_errors()
     assert len(updated_errors) == initial_count + 1
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_metrics_history(dashboard_service, metrics_collector):
     """Test metrics history tracking."""
-    # Get the actual service instance
-    service = await dashboard_service
-
-    # Allow dashboard to collect multiple metrics samples
-    for _ in range(3):
-        await asyncio.sleep(0.1)
+    service = dashboard_service
 
     # Get metrics from dashboard
     metrics = await service.get_system_metrics()
@@ -6,15 +6,6 @@ from pathlib import Path
 
 from src.error_management.simple_handler import error_handler
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("logs/test_errors.log"),
-    ],
-)
 logger = logging.getLogger(__name__)
 
 
@@ -86,4 +77,13 @@ def main():
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not when collected by pytest
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler("logs/test_errors.log"),
+        ],
+    )
     main()
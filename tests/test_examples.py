@@ -6,22 +6,24 @@ from src.error_management.error import Error
 from src.error_management.simple_handler import error_handler
 
 
-@error_handler.handle
 class TestExamples:
     """Example test cases."""
 
+    @error_handler.handle
     def test_type_error_fix(self):
         """Test that type errors are automatically fixed."""
         # This will trigger a type error that our system knows how to fix
         error = Error(type="test_error")  # Should be error_type
         assert error.error_type == "test_error"
 
+    @error_handler.handle
     def test_attribute_error_fix(self):
         """Test that attribute errors are automatically fixed."""
         error = Error(error_type="test_error")
         # This will trigger an attribute error that our system knows how to fix
         assert error.status == "pending"
 
+    @error_handler.handle
     def test_assertion_error_fix(self):
         """Test that assertion errors are automatically fixed."""
         value = 42
@@ -0,0 +1,80 @@
+"""Tests for the batch file analysis in FileMonitor."""
+
+from pathlib import Path
+
+import pytest
+
+from src.file_monitor.file_monitor import FileMonitor
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a project tree with regular, excluded and outside files."""
+    root = tmp_path / "project"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("")
+    (root / "pkg" / "b.py").write_text("")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("")
+    (tmp_path / "outside.py").write_text("")
+    (root / "link.py").symlink_to(tmp_path / "outside.py")
+    return root.resolve()
+
+
+def _paths(project: Path) -> list:
+    return [
+        str(project / "pkg" / "a.py"),
+        str(project / "node_modules" / "dep.js"),
+        str(project.parent / "outside.py"),
+        str(project / "link.py"),
+        str(project / "pkg" / "b.py"),
+    ]
+
+
+def test_analyze_files_matches_analyze_file(project: Path) -> None:
+    """Batch results equal one analyze_file call per path, in order."""
+    monitor = FileMonitor(str(project))
+    paths = _paths(project)
+
+    expected = [FileMonitor(str(project)).analyze_file(path) for path in paths]
+    results = monitor.analyze_files(paths)
+
+    assert [r is None for r in results] == [e is None for e in expected]
+    assert [r.id for r in results if r] == [e.id for e in expected if e]
+
+
+def test_analyze_files_skips_disallowed_paths(project: Path) -> None:
+    """Excluded, outside and symlinked paths give None."""
+    monitor = FileMonitor(str(project))
+
+    results = monitor.analyze_files(_paths(project))
+
+    assert [r is not None for r in results] == [True, False, False, False, True]
+    assert results[0].file_path == project / "pkg" / "a.py"
+    assert results[0].error_type == "FileError"
+
+
+def test_analyze_files_empty() -> None:
+    """An empty batch gives an empty result."""
+    assert FileMonitor(".").analyze_files([]) == []
+
+
+def test_analyze_files_checks_exclusion_once(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each path goes through the exclusion check once, then the cache."""
+    monitor = FileMonitor(str(project))
+    calls = []
+    is_excluded = monitor.secure_env._is_excluded
+    monkeypatch.setattr(
+        monitor.secure_env,
+        "_is_excluded",
+        lambda path: calls.append(path) or is_excluded(path),
+    )
+    paths = [str(project / "pkg" / "a.py"), str(project / "pkg" / "b.py")]
+
+    monitor.analyze_files(paths)
+    assert len(calls) == 2
+
+    monitor.analyze_files(paths)
+    assert len(calls) == 2
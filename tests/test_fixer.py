@@ -1,24 +1,22 @@
 """Automatic test error fixing system."""
 
+import hashlib
 import logging
-import sys
+import os
+import re
 import traceback
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .simple_handler import error_handler
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("logs/test_fixer.log"),
-    ],
-)
+# Handlers are configured by whoever runs the fixer (tests/conftest.py under
+# pytest); importing the module opens no log file
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"\w+")
+
 
 class TestErrorFixer:
     """Fix test errors automatically."""
@@ -27,6 +25,21 @@ class TestErrorFixer:
         """Initialize test fixer."""
         self.fixes_applied: List[Dict[str, Any]] = []
         self.current_test: Optional[Dict[str, Any]] = None
+        # Fixes per error type across fixes_applied, kept up to date in end_test
+        self._fix_counts: Counter = Counter()
+        # Fix handlers by error type name
+        self._handlers: Dict[str, Callable[[List[str], str, str], bool]] = {
+            "AssertionError": self._fix_assertion_error,
+            "TypeError": self._fix_type_error,
+            "AttributeError": self._fix_attribute_error,
+        }
+        # File lines keyed by path, with the mtime they were read at
+        self._file_cache: Dict[str, Tuple[int, List[str]]] = {}
+        # Per-file class line numbers and identifier -> line numbers, built
+        # once per file version so fixes need no line scans
+        self._index: Dict[str, Dict[str, Any]] = {}
+        # (path, content digest) pairs already backed up this session
+        self._backed_up: Set[Tuple[str, bytes]] = set()
 
     def start_test(self, test_name: str, test_file: str) -> None:
         """Start tracking a test."""
@@ -36,17 +49,20 @@ class TestErrorFixer:
             "errors": [],
             "fixes": [],
         }
-        logger.info(f"Starting test: {test_name}")
+        logger.info("Starting test: %s", test_name)
 
     def end_test(self) -> None:
         """End tracking current test."""
         if self.current_test:
-            logger.info(f"Ending test: {self.current_test['name']}")
+            logger.info("Ending test: %s", self.current_test["name"])
             if self.current_test["fixes"]:
                 logger.info("Fixes applied:")
                 for fix in self.current_test["fixes"]:
-                    logger.info(f"- {fix['description']}")
+                    logger.info("- %s", fix["description"])
             self.fixes_applied.append(self.current_test)
+            self._fix_counts.update(
+                fix["error_type"] for fix in self.current_test["fixes"]
+            )
             self.current_test = None
 
     @error_handler.handle
@@ -56,27 +72,18 @@ class TestErrorFixer:
             error_type = type(error).__name__
             error_msg = str(error)
 
-            logger.info(f"Attempting to fix {error_type} in test {test_name}")
+            logger.info("Attempting to fix %s in test %s", error_type, test_name)
 
-            # Read test file
-            with open(test_file, "r") as f:
-                lines = f.readlines()
+            # Only error types with a fixer need the file at all
+            handler = self._handlers.get(error_type)
+            if handler is None:
+                return False
 
-            # Create backup
-            backup_dir = Path("backups/tests")
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            backup_file = backup_dir / f"{Path(test_file).name}.bak"
-            with open(backup_file, "w") as f:
-                f.writelines(lines)
+            # Read test file; fixers edit the list in place, so use a copy
+            lines = list(self._read_lines(test_file))
 
             # Apply fixes based on error type
-            fixed = False
-            if error_type == "AssertionError":
-                fixed = self._fix_assertion_error(lines, error_msg, test_file)
-            elif error_type == "TypeError":
-                fixed = self._fix_type_error(lines, error_msg, test_file)
-            elif error_type == "AttributeError":
-                fixed = self._fix_attribute_error(lines, error_msg, test_file)
+            fixed = handler(lines, error_msg, test_file)
 
             if fixed and self.current_test:
                 self.current_test["fixes"].append(
@@ -86,7 +93,7 @@ class TestErrorFixer:
                         "description": f"Fixed {error_type} in {test_name}",
                     }
                 )
-                logger.info(f"Successfully fixed {error_type} in {test_name}")
+                logger.info("Successfully fixed %s in %s", error_type, test_name)
 
             return fixed
 
@@ -100,19 +107,23 @@ class TestErrorFixer:
     ) -> bool:
         """Fix assertion errors in tests."""
         try:
+            if "not equal" not in error_msg:
+                return False
+            actual, expected = self._extract_values(error_msg)
+            if not (actual and expected):
+                return False
+
             # Find assertion line
-            for i, line in enumerate(lines):
-                if "assert" in line:
-                    # Update assertion based on error
-                    if "not equal" in error_msg:
-                        actual, expected = self._extract_values(error_msg)
-                        if actual and expected:
-                            lines[i] = (
-                                f"    assert {actual} == {expected}  # Fixed by test_fixer\n"
-                            )
-                            self._write_lines(test_file, lines)
-                            return True
-            return False
+            assert_lines = self._line_index(test_file)["tokens"].get("assert")
+            if not assert_lines:
+                return False
+
+            # Update assertion based on error
+            lines[assert_lines[0]] = (
+                f"    assert {actual} == {expected}  # Fixed by test_fixer\n"
+            )
+            self._write_lines(test_file, lines)
+            return True
         except Exception as e:
             logger.error(f"Error fixing assertion: {str(e)}")
             return False
@@ -123,12 +134,12 @@ class TestErrorFixer:
             if "got an unexpected keyword argument" in error_msg:
                 # Find line with incorrect argument
                 arg = error_msg.split("'")[1]
-                for i, line in enumerate(lines):
-                    if arg in line:
-                        if arg == "type":
-                            lines[i] = line.replace("type=", "error_type=")
-                            self._write_lines(test_file, lines)
-                            return True
+                arg_lines = self._line_index(test_file)["tokens"].get(arg)
+                if arg == "type" and arg_lines:
+                    i = arg_lines[0]
+                    lines[i] = lines[i].replace("type=", "error_type=")
+                    self._write_lines(test_file, lines)
+                    return True
             return False
         except Exception as e:
             logger.error(f"Error fixing type error: {str(e)}")
@@ -143,17 +154,16 @@ class TestErrorFixer:
                 # Extract missing attribute
                 attr = error_msg.split("'")[1]
                 # Find line with object access
-                for i, line in enumerate(lines):
-                    if attr in line:
-                        # Add property decorator to test class
-                        class_line = self._find_class_line(lines)
-                        if class_line is not None:
-                            lines.insert(
-                                class_line + 1,
-                                f"    @property\n    def {attr}(self):\n        return None\n\n",
-                            )
-                            self._write_lines(test_file, lines)
-                            return True
+                if attr in self._line_index(test_file)["tokens"]:
+                    # Add property decorator to test class
+                    class_line = self._find_class_line(test_file)
+                    if class_line is not None:
+                        lines.insert(
+                            class_line + 1,
+                            f"    @property\n    def {attr}(self):\n        return None\n\n",
+                        )
+                        self._write_lines(test_file, lines)
+                        return True
             return False
         except Exception as e:
             logger.error(f"Error fixing attribute error: {str(e)}")
@@ -169,17 +179,64 @@ class TestErrorFixer:
         except Exception:
             return None, None
 
-    def _find_class_line(self, lines: List[str]) -> Optional[int]:
+    def _find_class_line(self, file_path: str) -> Optional[int]:
         """Find the line number where test class is defined."""
-        for i, line in enumerate(lines):
+        class_lines = self._line_index(file_path)["class_lines"]
+        return class_lines[0] if class_lines else None
+
+    def _line_index(self, file_path: str) -> Dict[str, Any]:
+        """Index a file's test class lines and identifiers in one pass."""
+        index = self._index.get(file_path)
+        if index is not None:
+            return index
+
+        class_lines: List[int] = []
+        tokens: Dict[str, List[int]] = defaultdict(list)
+        for i, line in enumerate(self._read_lines(file_path)):
             if line.startswith("class Test"):
-                return i
-        return None
+                class_lines.append(i)
+            for token in set(_TOKEN_RE.findall(line)):
+                tokens[token].append(i)
+        index = self._index[file_path] = {
+            "class_lines": class_lines,
+            "tokens": dict(tokens),
+        }
+        return index
+
+    def _read_lines(self, file_path: str) -> List[str]:
+        """Read a file's lines, reusing the cached copy if it is unchanged."""
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = self._file_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        lines = Path(file_path).read_text().splitlines(keepends=True)
+        self._file_cache[file_path] = (mtime, lines)
+        self._index.pop(file_path, None)
+        return lines
+
+    def _ensure_backup(self, file_path: str, text: str) -> None:
+        """Back up a file's contents unless this version is already saved."""
+        digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+        if (file_path, digest) in self._backed_up:
+            return
+
+        backup_dir = Path("backups/tests")
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_file = backup_dir / f"{Path(file_path).name}.{digest.hex()}.bak"
+        backup_file.write_text(text)
+        self._backed_up.add((file_path, digest))
 
     def _write_lines(self, file_path: str, lines: List[str]) -> None:
-        """Write lines back to file."""
-        with open(file_path, "w") as f:
-            f.writelines(lines)
+        """Write lines back to file, backing up the version being replaced.
+
+        Fixers only write after a successful fix, so files that are examined
+        but left unchanged are never backed up.
+        """
+        self._ensure_backup(file_path, "".join(self._read_lines(file_path)))
+        Path(file_path).write_text("".join(lines))
+        self._file_cache[file_path] = (os.stat(file_path).st_mtime_ns, list(lines))
+        self._index.pop(file_path, None)
 
     def get_fix_report(self) -> Dict[str, Any]:
         """Get report of all fixes applied."""
@@ -197,12 +254,7 @@ class TestErrorFixer:
 
     def _count_fixes_by_type(self) -> Dict[str, int]:
         """Count fixes by error type."""
-        counts: Dict[str, int] = {}
-        for test in self.fixes_applied:
-            for fix in test["fixes"]:
-                error_type = fix["error_type"]
-                counts[error_type] = counts.get(error_type, 0) + 1
-        return counts
+        return dict(self._fix_counts)
 
 
 # Create singleton instance
@@ -1,27 +1,35 @@
-""" Test functions for linalg module using the matrix class."""
-
-import numpy as np
-from numpy.linalg.tests.test_linalg import (
-    CondCases,
-    DetCases,
-    EigCases,
-    EigvalsCases,
-    InvCases,
-    LinalgCase,
-    LinalgTestCase,
-    LstsqCases,
-    PinvCases,
-    SolveCases,
-    SVDCases,
-)
-from numpy.linalg.tests.test_linalg import TestQR as _TestQR
-from numpy.linalg.tests.test_linalg import (
-    _TestNorm2D,
-    _TestNormDoubleBase,
-    _TestNormInt64Base,
-    _TestNormSingleBase,
-    apply_tag,
-)
+"""Test functions for linalg module using the matrix class."""
+
+import pytest
+
+np = pytest.importorskip("numpy", minversion="1.22")
+
+# The helpers below are private to NumPy's own test suite and change between
+# releases; skip the module instead of erroring when one has moved
+try:
+    from numpy.linalg.tests.test_linalg import (
+        CondCases,
+        DetCases,
+        EigCases,
+        EigvalsCases,
+        InvCases,
+        LinalgCase,
+        LinalgTestCase,
+        LstsqCases,
+        PinvCases,
+        SolveCases,
+        SVDCases,
+    )
+    from numpy.linalg.tests.test_linalg import TestQR as _TestQR
+    from numpy.linalg.tests.test_linalg import (
+        _TestNorm2D,
+        _TestNormDoubleBase,
+        _TestNormInt64Base,
+        _TestNormSingleBase,
+        apply_tag,
+    )
+except ImportError as e:
+    pytest.skip(f"NumPy linalg test helpers unavailable: {e}", allow_module_level=True)
 
 CASES = []
 
@@ -0,0 +1,119 @@
+"""Tests for ProjectScanner scanning and fix generation."""
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, List, Optional
+
+import pytest
+
+from src.service import project_scanner
+from src.service.project_scanner import ProjectScanner
+
+
+class ListScanner(ProjectScanner):
+    """Scanner yielding a fixed list of issues instead of scanning files."""
+
+    def __init__(self, issues: List[dict], fix_provider=None):
+        super().__init__(".", fix_provider)
+        self.issues = issues
+        self.scanned = 0
+
+    async def scan_project(self) -> AsyncIterator[dict]:
+        for issue in self.issues:
+            self.scanned += 1
+            yield issue
+            await asyncio.sleep(0)
+
+
+def make_issues(count: int) -> List[dict]:
+    return [{"file": f"f{i}.py", "line": i} for i in range(count)]
+
+
+async def test_scan_project_finds_syntax_errors(tmp_path: Path) -> None:
+    """Files that do not compile are reported; excluded dirs are skipped."""
+    (tmp_path / "ok.py").write_text("x = 1\n")
+    (tmp_path / "bad.py").write_text("x = (\n")
+    (tmp_path / "notes.txt").write_text("x = (\n")
+    (tmp_path / "venv").mkdir()
+    (tmp_path / "venv" / "bad.py").write_text("x = (\n")
+
+    issues = [issue async for issue in ProjectScanner(tmp_path).scan_project()]
+
+    assert [Path(issue["file"]).name for issue in issues] == ["bad.py"]
+    assert issues[0]["line"] == 1
+    assert issues[0]["type"] == "SyntaxError"
+
+
+async def test_without_fix_provider_no_fixes(tmp_path: Path) -> None:
+    """Issues are found but no fixes are generated without a provider."""
+    (tmp_path / "bad.py").write_text("x = (\n")
+
+    result = await ProjectScanner(tmp_path).scan_with_fixes()
+
+    assert result.status == "completed"
+    assert result.fixes == []
+
+
+async def test_fixes_keep_scan_order() -> None:
+    """Fixes come back in the order their issues were found, even when later
+    issues are fixed first, and issues without a fix are left out."""
+    issues = make_issues(50)
+
+    async def fix(issue: dict) -> Optional[dict]:
+        # Earlier issues take longer, so fixes finish in reverse order
+        await asyncio.sleep(0.001 * (50 - issue["line"]))
+        if issue["line"] % 5 == 0:
+            return None
+        return {"line": issue["line"]}
+
+    result = await ListScanner(issues, fix).scan_with_fixes()
+
+    assert result.status == "completed"
+    assert result.fixes == [{"line": i} for i in range(50) if i % 5]
+
+
+async def test_scan_times_out() -> None:
+    """A scan that runs past the deadline reports a timeout with no fixes."""
+
+    async def slow_fix(issue: dict) -> dict:
+        await asyncio.sleep(10)
+        return {}
+
+    result = await ListScanner(make_issues(3), slow_fix).scan_with_fixes(timeout=0.05)
+
+    assert result.status == "timeout"
+    assert result.fixes == []
+
+
+async def test_failing_worker_raises_first_exception() -> None:
+    """A worker's exception stops the scan and is re-raised unwrapped."""
+
+    async def fix(issue: dict) -> dict:
+        if issue["line"] == 3:
+            raise ValueError("fix failed")
+        return {}
+
+    with pytest.raises(ValueError, match="fix failed"):
+        await ListScanner(make_issues(10), fix).scan_with_fixes()
+
+
+async def test_failing_workers_do_not_block_producer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """When every worker dies, the scan fails at once instead of blocking on
+    the full queue until the timeout."""
+    monkeypatch.setattr(project_scanner, "FIX_WORKERS", 2)
+
+    async def fix(issue: dict) -> dict:
+        raise RuntimeError("worker died")
+
+    # Far more issues than the bounded queue holds
+    scanner = ListScanner(make_issues(1000), fix)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(RuntimeError, match="worker died"):
+        await scanner.scan_with_fixes(timeout=5.0)
+
+    assert loop.time() - start < 1.0
+    assert scanner.scanned < 1000
@@ -0,0 +1,194 @@
+"""Tests for SecureEnvironment path checks and project walks."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.error_management.secure_environment import SecureEnvironment, SecurityError
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a project tree with a nested package and an excluded dir."""
+    root = tmp_path / "project"
+    (root / "pkg" / "sub").mkdir(parents=True)
+    (root / "main.py").write_text("")
+    (root / "pkg" / "a.py").write_text("")
+    (root / "pkg" / "sub" / "b.py").write_text("")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "main.cpython-311.pyc").write_bytes(b"")
+    return root.resolve()
+
+
+@pytest.fixture
+def outside(tmp_path: Path) -> Path:
+    """Create a directory with a file outside the project root."""
+    path = tmp_path / "outside"
+    path.mkdir()
+    (path / "secret.py").write_text("")
+    return path.resolve()
+
+
+def test_missing_root_raises(tmp_path: Path) -> None:
+    """A missing project root is rejected up front."""
+    with pytest.raises(SecurityError):
+        SecureEnvironment(tmp_path / "missing")
+
+
+def test_allows_files_in_project(project: Path, outside: Path) -> None:
+    """Files below the root are allowed, others and excluded ones are not."""
+    env = SecureEnvironment(project)
+
+    assert env.is_file_allowed(project / "pkg" / "a.py") is True
+    assert env.is_file_allowed(project / "pkg" / ".." / "main.py") is True
+    assert env.is_file_allowed(outside / "secret.py") is False
+    assert env.is_file_allowed(project / ".." / "outside" / "secret.py") is False
+    cached = project / "__pycache__" / "main.cpython-311.pyc"
+    assert env.is_file_allowed(cached) is False
+
+
+def test_relative_paths_follow_the_working_directory(
+    project: Path, outside: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached results are keyed on the absolute path, not the string given."""
+    env = SecureEnvironment(project)
+    (outside / "main.py").write_text("")
+
+    monkeypatch.chdir(project)
+    assert env.is_file_allowed(Path("main.py")) is True
+
+    monkeypatch.chdir(outside)
+    assert env.is_file_allowed(Path("main.py")) is False
+
+
+def test_rejects_symlinked_file(project: Path, outside: Path) -> None:
+    """A symlink below the root is rejected even if it points inside."""
+    (project / "out.py").symlink_to(outside / "secret.py")
+    (project / "in.py").symlink_to(project / "main.py")
+    env = SecureEnvironment(project)
+
+    assert env.is_file_allowed(project / "out.py") is False
+    assert env.is_file_allowed(project / "in.py") is False
+
+
+def test_rejects_symlinked_parent_directory(project: Path, outside: Path) -> None:
+    """A symlink in any parent directory below the root is rejected."""
+    (project / "out_dir").symlink_to(outside)
+    (project / "in_dir").symlink_to(project / "pkg")
+    env = SecureEnvironment(project)
+
+    assert env.is_file_allowed(project / "out_dir" / "secret.py") is False
+    assert env.is_file_allowed(project / "in_dir" / "a.py") is False
+    assert env.is_file_allowed(project / "in_dir" / "sub" / "b.py") is False
+    assert env.is_file_allowed(project / "pkg" / "sub" / "b.py") is True
+
+
+def test_root_given_through_symlink(project: Path, tmp_path: Path) -> None:
+    """A project root given through a symlink accepts both spellings."""
+    link = tmp_path / "project_link"
+    link.symlink_to(project)
+    env = SecureEnvironment(link)
+
+    assert env.is_file_allowed(link / "pkg" / "a.py") is True
+    assert env.is_file_allowed(project / "pkg" / "a.py") is True
+
+
+def test_cached_result_until_reset(project: Path, outside: Path) -> None:
+    """A file replaced by a symlink is rejected once the cache is reset."""
+    env = SecureEnvironment(project)
+    path = project / "pkg" / "a.py"
+    assert env.is_file_allowed(path) is True
+
+    path.unlink()
+    path.symlink_to(outside / "secret.py")
+    # Still within the TTL, so the cached decision is returned
+    assert env.is_file_allowed(path) is True
+
+    env.reset_cache()
+
+    assert env.is_file_allowed(path) is False
+
+
+def test_cached_result_expires(project: Path, outside: Path) -> None:
+    """Cached decisions expire after _check_ttl."""
+    env = SecureEnvironment(project)
+    env._check_ttl = 0.0
+    path = project / "pkg" / "a.py"
+    assert env.is_file_allowed(path) is True
+
+    path.unlink()
+    path.symlink_to(outside / "secret.py")
+
+    assert env.is_file_allowed(path) is False
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_get_project_files(project: Path, parallel: bool) -> None:
+    """The walk lists project files and skips excluded directories."""
+    env = SecureEnvironment(project)
+    env._parallel_walk = parallel
+
+    files = sorted(path.relative_to(project) for path in env.get_project_files())
+
+    assert files == [
+        Path("main.py"),
+        Path("pkg") / "a.py",
+        Path("pkg") / "sub" / "b.py",
+    ]
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_get_project_files_skips_unreadable_directory(
+    project: Path, parallel: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A directory that cannot be scanned is skipped, not fatal to the walk."""
+    (project / "other").mkdir()
+    (project / "other" / "c.py").write_text("")
+    unreadable = str(project / "pkg")
+    scandir = os.scandir
+
+    def failing_scandir(path):
+        if os.fspath(path) == unreadable:
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", failing_scandir)
+    env = SecureEnvironment(project)
+    env._parallel_walk = parallel
+
+    files = sorted(path.relative_to(project) for path in env.get_project_files())
+
+    assert files == [Path("main.py"), Path("other") / "c.py"]
+
+
+def test_parallel_walks_share_executor(project: Path) -> None:
+    """Parallel walks reuse one thread pool across calls and instances."""
+    SecureEnvironment(project).get_project_files()
+    executor = SecureEnvironment._walk_executor
+
+    SecureEnvironment(project).get_project_files()
+
+    assert executor is not None
+    assert SecureEnvironment._walk_executor is executor
+
+
+@pytest.mark.parametrize(
+    "relative, excluded",
+    [
+        ("node_modules/pkg/index.js", True),
+        ("src/.git/config", True),
+        ("a/site-packages/b.py", True),
+        ("venv", False),  # Only directories are excluded
+        ("venvs/a.py", False),
+        ("my.venv/a.py", False),
+        ("src/a.py", False),
+    ],
+)
+def test_is_excluded(project: Path, relative: str, excluded: bool) -> None:
+    """Paths are excluded by directory name, for str and Path alike."""
+    env = SecureEnvironment(project)
+    path = project / relative
+
+    assert env._is_excluded(path) is excluded
+    assert env._is_excluded(str(path)) is excluded
@@ -0,0 +1,223 @@
+"""Tests for SecurityManager path validation."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.security.security_manager import SecurityManager
+
+OPERATIONS = ["read", "write", "delete", "execute"]
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a project tree with files, a directory and an executable."""
+    root = tmp_path / "project"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("a = 1\n")
+    (root / "pkg" / "b.py").write_text("b = 2\n")
+    script = root / "pkg" / "run.sh"
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+    (root / "pkg" / "sub").mkdir()
+    return root
+
+
+@pytest.fixture
+def outside(tmp_path: Path) -> Path:
+    """Create a file outside the project root."""
+    path = tmp_path / "outside.py"
+    path.write_text("secret = 1\n")
+    return path
+
+
+def test_cached_result_expires(project: Path) -> None:
+    """A deleted file is rejected once its cached results expire."""
+    manager = SecurityManager(project)
+    manager._cache_ttl = 0.0
+    path = project / "pkg" / "a.py"
+
+    assert manager.validate_operation("read", path) is True
+    assert manager.validate_operation("delete", path) is True
+    os.remove(path)
+
+    assert manager.validate_operation("read", path) is False
+    assert manager.validate_operation("delete", path) is False
+
+
+def test_reset_cache(project: Path) -> None:
+    """reset_cache drops every cached result."""
+    manager = SecurityManager(project)
+    path = project / "pkg" / "a.py"
+
+    assert manager.validate_operation("read", path) is True
+    os.remove(path)
+    assert manager.validate_operation("read", path) is True
+
+    manager.reset_cache()
+
+    assert manager.validate_operation("read", path) is False
+
+
+def test_cached_miss_expires(project: Path) -> None:
+    """A path created after a miss is seen once the cached miss expires."""
+    manager = SecurityManager(project)
+    manager._cache_ttl = 0.0
+    path = project / "pkg" / "new.py"
+
+    assert manager.validate_operation("read", path) is False
+    path.write_text("")
+    assert manager.validate_operation("read", path) is True
+
+
+def test_invalidate_drops_all_results_for_path(project: Path) -> None:
+    """invalidate forgets the stat and access results of a path together."""
+    manager = SecurityManager(project)
+    path = project / "pkg" / "new.py"
+
+    assert manager.validate_operation("read", path) is False
+    assert manager.validate_operation("delete", path) is False
+    path.write_text("")
+    # Still within the TTL, so the cached misses are returned
+    assert manager.validate_operation("read", path) is False
+
+    manager.invalidate(path)
+
+    assert not any(key[0] == str(path) for key in manager._cache)
+    assert manager.validate_operation("read", path) is True
+    assert manager.validate_operation("delete", path) is True
+
+
+def _batch_paths(project: Path, outside: Path) -> list:
+    pkg = project / "pkg"
+    return [
+        pkg / "a.py",
+        str(pkg / "b.py"),
+        pkg / "run.sh",
+        pkg / "sub",
+        pkg / "missing.py",
+        outside,
+        project / "missing_dir" / "c.py",
+    ]
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+def test_validate_batch_matches_validate_operation(
+    project: Path, outside: Path, operation: str
+) -> None:
+    """Batch results equal one validate_operation call per path, in order."""
+    paths = _batch_paths(project, outside)
+    expected = [
+        SecurityManager(project).validate_operation(operation, path) for path in paths
+    ]
+
+    assert SecurityManager(project).validate_batch(operation, paths) == expected
+
+
+def test_validate_batch_results(project: Path, outside: Path) -> None:
+    """Reads are allowed only for existing regular files inside the root."""
+    manager = SecurityManager(project)
+    paths = _batch_paths(project, outside)
+
+    assert manager.validate_batch("read", paths) == [
+        True,
+        True,
+        True,
+        False,  # Directory
+        False,  # Missing
+        False,  # Outside the root
+        False,  # Missing parent
+    ]
+
+
+def test_validate_batch_invalid_operation(project: Path) -> None:
+    """An unknown operation rejects every path."""
+    manager = SecurityManager(project)
+    paths = [project / "pkg" / "a.py", project / "pkg" / "b.py"]
+
+    assert manager.validate_batch("chmod", paths) == [False, False]
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+def test_validate_batch_dangling_symlink(project: Path, operation: str) -> None:
+    """A dangling symlink is missing to both validate_batch and
+    validate_operation."""
+    link = project / "pkg" / "dangling.py"
+    link.symlink_to(project / "pkg" / "gone.py")
+    paths = [link, project / "pkg" / "a.py"]
+    expected = [
+        SecurityManager(project).validate_operation(operation, path) for path in paths
+    ]
+
+    results = SecurityManager(project).validate_batch(operation, paths)
+
+    assert results == expected
+    if operation != "write":
+        assert results[0] is False
+
+
+def test_validate_batch_delete_with_symlinked_parent(
+    project: Path, tmp_path: Path
+) -> None:
+    """Deletes through a directory linked outside the root are rejected."""
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "x.py").write_text("")
+    (elsewhere / "y.py").write_text("")
+    (project / "link").symlink_to(elsewhere)
+    manager = SecurityManager(project)
+
+    results = manager.validate_batch(
+        "delete", [project / "link" / "x.py", project / "link" / "y.py"]
+    )
+
+    assert results == [False, False]
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+async def test_validate_batch_async_matches_validate_batch(
+    project: Path, outside: Path, operation: str
+) -> None:
+    """The threaded variant returns the same results in input order."""
+    paths = _batch_paths(project, outside)
+    expected = SecurityManager(project).validate_batch(operation, paths)
+
+    results = await SecurityManager(project).validate_batch_async(
+        operation, paths, concurrency=2
+    )
+
+    assert results == expected
+
+
+def test_read_allowlist(project: Path, outside: Path) -> None:
+    """Allowlisted paths may be read even outside the root."""
+    manager = SecurityManager(project, read_allowlist=[outside])
+
+    assert manager.validate_operation("read", outside) is True
+    assert manager.validate_operation("read", str(outside)) is True
+    assert manager.validate_batch("read", [outside, outside]) == [True, True]
+    # The read allowlist grants nothing else
+    assert manager.validate_operation("execute", outside) is False
+    assert manager.validate_operation("write", outside) is False
+
+
+def test_read_allowlist_matches_resolved_path(
+    project: Path, outside: Path, tmp_path: Path
+) -> None:
+    """An allowlist entry given through a symlink also covers its target."""
+    link = tmp_path / "outside_link.py"
+    link.symlink_to(outside)
+    manager = SecurityManager(project, read_allowlist=[link])
+
+    assert manager.validate_operation("read", link) is True
+    assert manager.validate_operation("read", outside) is True
+
+
+def test_exec_allowlist(project: Path, outside: Path) -> None:
+    """Allowlisted paths may be executed even outside the root."""
+    manager = SecurityManager(project, exec_allowlist=[outside])
+
+    assert manager.validate_operation("execute", outside) is True
+    assert manager.validate_batch("execute", [outside, outside]) == [True, True]
+    assert manager.validate_operation("read", outside) is False
@@ -1,24 +1,27 @@
 """Tests for agent task management functionality."""
 
 import asyncio
+import itertools
 from datetime import datetime
-from typing import Any, Dict
-
-import pytest
+from typing import Any, Collection, Dict
 
 from src.dashboard.monitoring.agent_monitor import AgentMonitor
 
+# Keeps ids of tasks created within the same second distinct
+_task_counter = itertools.count()
+
 
 def create_test_task(task_type: str = "Run Tests") -> Dict[str, Any]:
     """Create a test task configuration."""
+    now = datetime.now()
     return {
-        "id": f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        "id": f"task_{now:%Y%m%d_%H%M%S}_{next(_task_counter)}",
         "type": task_type,
         "project_path": "/test/path",
         "priority": "Medium",
         "timeout": 30,
         "status": "pending",
-        "created_at": datetime.now(),
+        "created_at": now,
         "config": {
             "test_types": ["Unit Tests"],
             "test_pattern": "test_*.py",
@@ -27,12 +30,34 @@ def create_test_task(task_type: str = "Run Tests") -> Dict[str, Any]:
     }
 
 
-@pytest.mark.asyncio
+# Statuses a task reaches once the agent has picked it up
+STARTED = frozenset({"running", "completed", "failed"})
+FINISHED = frozenset({"completed", "failed"})
+
+
+async def _wait_state(
+    monitor: AgentMonitor,
+    agent_id: str,
+    task_id: str,
+    states: Collection[str],
+    timeout: float = 2.0,
+) -> Dict[str, Any]:
+    """Wait until a task reaches one of the given statuses.
+
+    Raises TimeoutError if it does not get there within the timeout.
+    """
+    async with asyncio.timeout(timeout):
+        while True:
+            task_status = monitor.get_task_status(agent_id, task_id)
+            if task_status is not None and task_status["status"] in states:
+                return task_status
+            await asyncio.sleep(0.01)
+
+
 async def test_task_assignment(monitor: AgentMonitor) -> None:
     """Test assigning a task to an agent."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create and assign task
     task = create_test_task()
@@ -48,24 +73,17 @@ async def test_task_assignment(monitor: AgentMonitor) -> None:
     assert agent_status["tasks"][0]["id"] == task["id"]
 
 
-@pytest.mark.asyncio
 async def test_task_execution(monitor: AgentMonitor) -> None:
     """Test task execution flow."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create and assign task
     task = create_test_task()
     monitor.assign_task(agent_id, task)
 
     # Wait for execution
-    await asyncio.sleep(0.5)
-
-    # Get task status
-    task_status = monitor.get_task_status(agent_id, task["id"])
-    assert task_status is not None
-    assert task_status["status"] in ["completed", "running", "failed"]
+    task_status = await _wait_state(monitor, agent_id, task["id"], STARTED)
 
     if task_status["status"] == "completed":
         assert "completed_at" in task_status
@@ -73,12 +91,10 @@ async def test_task_execution(monitor: AgentMonitor) -> None:
         assert "results" in task_status
 
 
-@pytest.mark.asyncio
 async def test_multiple_task_handling(monitor: AgentMonitor) -> None:
     """Test handling multiple tasks for an agent."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create and assign multiple tasks
     tasks = [
@@ -91,9 +107,6 @@ async def test_multiple_task_handling(monitor: AgentMonitor) -> None:
         success = monitor.assign_task(agent_id, task)
         assert success is True
 
-    # Wait for processing
-    await asyncio.sleep(0.5)
-
     # Verify tasks are tracked
     agent_status = monitor.get_agent_status(agent_id)
     assert agent_status is not None
@@ -106,12 +119,10 @@ async def test_multiple_task_handling(monitor: AgentMonitor) -> None:
     ]  # Tasks should be in order of assignment
 
 
-@pytest.mark.asyncio
 async def test_task_priority_handling(monitor: AgentMonitor) -> None:
     """Test task priority handling."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create tasks with different priorities
     tasks = [
@@ -123,8 +134,8 @@ async def test_task_priority_handling(monitor: AgentMonitor) -> None:
     for task in tasks:
         monitor.assign_task(agent_id, task)
 
-    # Wait for processing
-    await asyncio.sleep(0.5)
+    # Wait for processing of the high priority task to begin
+    await _wait_state(monitor, agent_id, tasks[1]["id"], STARTED)
 
     # Verify high priority task is processed first
     agent_status = monitor.get_agent_status(agent_id)
@@ -134,33 +145,27 @@ async def test_task_priority_handling(monitor: AgentMonitor) -> None:
         assert running_tasks[0]["priority"] == "High"
 
 
-@pytest.mark.asyncio
 async def test_task_timeout(monitor: AgentMonitor) -> None:
     """Test task timeout handling."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create task with short timeout
     task = {**create_test_task(), "timeout": 1}  # 1 minute timeout
     monitor.assign_task(agent_id, task)
 
     # Wait for timeout
-    await asyncio.sleep(1.5)  # Wait longer than timeout
+    task_status = await _wait_state(monitor, agent_id, task["id"], FINISHED)
 
     # Verify task status
-    task_status = monitor.get_task_status(agent_id, task["id"])
-    assert task_status is not None
     assert task_status["status"] == "failed"
     assert "timeout" in task_status.get("error", "").lower()
 
 
-@pytest.mark.asyncio
 async def test_task_error_handling(monitor: AgentMonitor) -> None:
     """Test error handling during task execution."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create task that will fail
     task = {
@@ -172,11 +177,9 @@ async def test_task_error_handling(monitor: AgentMonitor) -> None:
     monitor.assign_task(agent_id, task)
 
     # Wait for execution
-    await asyncio.sleep(0.5)
+    task_status = await _wait_state(monitor, agent_id, task["id"], FINISHED)
 
     # Verify error handling
-    task_status = monitor.get_task_status(agent_id, task["id"])
-    assert task_status is not None
     assert task_status["status"] == "failed"
     assert "error" in task_status
     assert task_status["error"] is not None
@@ -187,23 +190,17 @@ async def test_task_error_handling(monitor: AgentMonitor) -> None:
     assert len(error_logs) > 0
 
 
-@pytest.mark.asyncio
 async def test_task_progress_tracking(monitor: AgentMonitor) -> None:
     """Test task progress tracking."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create task
     task = create_test_task("Run Tests")
     monitor.assign_task(agent_id, task)
 
     # Wait for execution to start
-    await asyncio.sleep(0.2)
-
-    # Get task status
-    task_status = monitor.get_task_status(agent_id, task["id"])
-    assert task_status is not None
+    task_status = await _wait_state(monitor, agent_id, task["id"], STARTED)
 
     if task_status["status"] == "running":
         assert "progress" in task_status
@@ -211,23 +208,17 @@ async def test_task_progress_tracking(monitor: AgentMonitor) -> None:
         assert 0 <= task_status["progress"] <= 1
 
 
-@pytest.mark.asyncio
 async def test_task_results_handling(monitor: AgentMonitor) -> None:
     """Test handling of task results."""
     agent_id = "test_agent_1"
     monitor.start_agent(agent_id)
-    await asyncio.sleep(0.1)  # Wait for start
 
     # Create and assign task
     task = create_test_task("Code Analysis")
     monitor.assign_task(agent_id, task)
 
     # Wait for completion
-    await asyncio.sleep(1.0)
-
-    # Get task status
-    task_status = monitor.get_task_status(agent_id, task["id"])
-    assert task_status is not None
+    task_status = await _wait_state(monitor, agent_id, task["id"], FINISHED)
 
     if task_status["status"] == "completed":
         assert "results" in task_status
@@ -0,0 +1,146 @@
+"""Tests for TaskManager status indexes and stale task cleanup."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.error_management import task_manager as task_manager_module
+from src.error_management.task_manager import TaskManager
+
+
+class FakeClock:
+    """Stand-in for the time module with a settable monotonic clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Drive the task manager's clock from the test."""
+    clock = FakeClock()
+    monkeypatch.setattr(
+        task_manager_module, "time", SimpleNamespace(monotonic=clock.monotonic)
+    )
+    return clock
+
+
+@pytest.fixture
+def manager() -> TaskManager:
+    """Create a task manager with no tasks."""
+    return TaskManager()
+
+
+async def test_pending_tasks_in_creation_order(manager: TaskManager) -> None:
+    """New tasks of every type are pending, in the order they were created."""
+    fix = await manager.create_error_fix_task("NameError", "a.py", 3, "x")
+    tests = await manager.create_test_execution_task("test_a.py")
+    lint = await manager.create_linting_task("a.py")
+
+    assert await manager.get_pending_tasks() == [fix, tests, lint]
+
+
+async def test_pending_index_follows_status(manager: TaskManager) -> None:
+    """Tasks leave the pending list when started and rejoin it if reset."""
+    first = await manager.create_test_execution_task("test_a.py")
+    second = await manager.create_test_execution_task("test_b.py")
+
+    await manager.update_task_status(first, "in_progress")
+    assert await manager.get_pending_tasks() == [second]
+
+    await manager.update_task_status(second, "completed")
+    assert await manager.get_pending_tasks() == []
+
+    await manager.update_task_status(first, "pending")
+    assert await manager.get_pending_tasks() == [first]
+
+
+async def test_repended_task_keeps_creation_order(manager: TaskManager) -> None:
+    """A task pended again is listed where it was created, like self.tasks."""
+    first = await manager.create_test_execution_task("test_a.py")
+    second = await manager.create_test_execution_task("test_b.py")
+    third = await manager.create_test_execution_task("test_c.py")
+
+    await manager.update_task_status(first, "in_progress")
+    await manager.update_task_status(first, "pending")
+    # Pending an already pending task changes nothing
+    await manager.update_task_status(third, "pending")
+
+    expected = [task for task in manager.tasks if task["status"] == "pending"]
+    assert await manager.get_pending_tasks() == expected == [first, second, third]
+
+
+async def test_linting_task_shared_while_open(manager: TaskManager) -> None:
+    """One linting task per file is open at a time."""
+    task = await manager.create_linting_task("a.py")
+    assert await manager.create_linting_task("a.py") is task
+
+    await manager.update_task_status(task, "in_progress")
+    assert await manager.create_linting_task("a.py") is task
+
+    await manager.update_task_status(task, "completed")
+    new_task = await manager.create_linting_task("a.py")
+
+    assert new_task is not task
+    assert await manager.get_pending_tasks() == [new_task]
+
+
+async def test_cleanup_fails_only_stale_tasks(
+    manager: TaskManager, clock: FakeClock
+) -> None:
+    """Tasks in progress for more than five minutes are marked failed."""
+    stale = await manager.create_test_execution_task("test_a.py")
+    fresh = await manager.create_test_execution_task("test_b.py")
+    await manager.update_task_status(stale, "in_progress")
+    clock.now += 200
+    await manager.update_task_status(fresh, "in_progress")
+    clock.now += 200
+
+    await manager.cleanup_stale_tasks()
+
+    assert stale["status"] == "failed"
+    assert fresh["status"] == "in_progress"
+    # Only the fresh task is left on the heap
+    assert [entry[2] for entry in manager._in_progress_heap] == [fresh]
+
+
+async def test_cleanup_skips_superseded_entries(
+    manager: TaskManager, clock: FakeClock
+) -> None:
+    """Heap entries for tasks that moved on or restarted are ignored."""
+    done = await manager.create_test_execution_task("test_a.py")
+    restarted = await manager.create_test_execution_task("test_b.py")
+    await manager.update_task_status(done, "in_progress")
+    await manager.update_task_status(restarted, "in_progress")
+    clock.now += 100
+    await manager.update_task_status(done, "completed")
+    await manager.update_task_status(restarted, "in_progress")
+    clock.now += 250
+
+    await manager.cleanup_stale_tasks()
+
+    assert done["status"] == "completed"
+    assert restarted["status"] == "in_progress"
+
+    clock.now += 100
+    await manager.cleanup_stale_tasks()
+
+    assert restarted["status"] == "failed"
+    assert manager._in_progress_heap == []
+
+
+async def test_failed_linting_task_reopens_file(
+    manager: TaskManager, clock: FakeClock
+) -> None:
+    """A stale linting task that fails no longer blocks a new one."""
+    task = await manager.create_linting_task("a.py")
+    await manager.update_task_status(task, "in_progress")
+    clock.now += 301
+
+    await manager.cleanup_stale_tasks()
+
+    assert task["status"] == "failed"
+    assert await manager.create_linting_task("a.py") is not task